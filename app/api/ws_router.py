@@ -1,19 +1,19 @@
 import base64
+import json
 import logging
 from typing import AsyncGenerator, Dict
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import TypeAdapter, ValidationError
 
 from core.interfaces.peripherals import BaseSTTProvider, BaseTTSProvider
 from core.schemas.events import (
-    ClientEvent,
     ClientEventType,
     ServerErrorEvent,
     ServerEvent,
     ServerAudioEvent,
     ServerStatusEvent,
     ServerTextEvent,
+    parse_client_event,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,9 +59,6 @@ class ConnectionManager:
         self.stt_provider: BaseSTTProvider = MockSTTProvider()
         self.tts_provider: BaseTTSProvider = MockTTSProvider()
         self.orchestrator = MockOrchestrator()
-        
-        # Pydantic v2 TypeAdapter for discriminated unions
-        self.client_event_adapter = TypeAdapter(ClientEvent)
 
     async def connect(self, session_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
@@ -74,11 +71,11 @@ class ConnectionManager:
             logger.info(f"Session {session_id} disconnected")
 
     async def send_event(self, session_id: str, event: ServerEvent) -> None:
-        """Sends a strongly-typed Pydantic ServerEvent over WebSocket."""
+        """Sends a strongly-typed ServerEvent over WebSocket."""
         if session_id in self.active_connections:
             websocket = self.active_connections[session_id]
             # Emit standard JSON back to the UI
-            await websocket.send_text(event.model_dump_json())
+            await websocket.send_text(event.to_json())
 
 
 manager = ConnectionManager()
@@ -96,65 +93,65 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str) -> None:
             # 1. Wait for ClientEvent
             data = await websocket.receive_text()
 
+            # 2. Decode and dispatch on the event type
             try:
-                # 2. Validate the JSON via Pydantic
-                client_event = manager.client_event_adapter.validate_json(data)
-                
-                # Check session mapping
-                if getattr(client_event, "session_id", None) != session_id:
-                    error_event = ServerErrorEvent(
-                        error=f"Session ID mismatch: expected {session_id}, got {client_event.session_id}"
+                client_event = parse_client_event(json.loads(data))
+            except ValueError as e:
+                # Invalid JSON structure or missing fields
+                await manager.send_event(
+                    session_id, ServerErrorEvent(error=f"Invalid event schema: {str(e)}")
+                )
+                continue
+
+            # Check session mapping
+            if getattr(client_event, "session_id", None) != session_id:
+                error_event = ServerErrorEvent(
+                    error=f"Session ID mismatch: expected {session_id}, got {client_event.session_id}"
+                )
+                await manager.send_event(session_id, error_event)
+                continue
+
+            text_input = ""
+
+            # 3. If audio is present, route to STT provider to get text
+            if client_event.type == ClientEventType.AUDIO:
+                try:
+                    audio_bytes = base64.b64decode(client_event.audio_base64)
+                    text_input = await manager.stt_provider.transcribe(audio_bytes)
+                except Exception as e:
+                    await manager.send_event(
+                        session_id, ServerErrorEvent(error=f"STT Error: {str(e)}")
                     )
-                    await manager.send_event(session_id, error_event)
                     continue
+            elif client_event.type == ClientEventType.TEXT:
+                text_input = client_event.text
+            elif client_event.type == ClientEventType.SYSTEM:
+                text_input = f"<system_command> {client_event.command}"
+
+            # 4. Pass the text to Orchestrator, Stream ServerEvents back
+            async for chunk in manager.orchestrator.process(text_input):
+                # We arbitrarily decide that "thinking" and "tool_running" are statuses
+                if chunk in ("thinking", "tool_running"):
+                    await manager.send_event(
+                        session_id, ServerStatusEvent(status=chunk)
+                    )
+                else:
+                    # Full text response
+                    await manager.send_event(
+                        session_id, ServerTextEvent(text=chunk)
+                    )
 
-                text_input = ""
-
-                # 3. If audio is present, route to STT provider to get text
-                if client_event.type == ClientEventType.AUDIO:
+                    # Provide binary audio (TTS) as part of pipeline
                     try:
-                        audio_bytes = base64.b64decode(client_event.audio_base64)
-                        text_input = await manager.stt_provider.transcribe(audio_bytes)
-                    except Exception as e:
+                        audio_output_bytes = await manager.tts_provider.synthesize(chunk)
+                        b64_audio = base64.b64encode(audio_output_bytes).decode("utf-8")
                         await manager.send_event(
-                            session_id, ServerErrorEvent(error=f"STT Error: {str(e)}")
+                            session_id, ServerAudioEvent(audio_base64=b64_audio)
                         )
-                        continue
-                elif client_event.type == ClientEventType.TEXT:
-                    text_input = client_event.text
-                elif client_event.type == ClientEventType.SYSTEM:
-                    text_input = f"<system_command> {client_event.command}"
-
-                # 4. Pass the text to Orchestrator, Stream ServerEvents back
-                async for chunk in manager.orchestrator.process(text_input):
-                    # We arbitrarily decide that "thinking" and "tool_running" are statuses
-                    if chunk in ("thinking", "tool_running"):
-                        await manager.send_event(
-                            session_id, ServerStatusEvent(status=chunk)
-                        )
-                    else:
-                        # Full text response
-                        await manager.send_event(
-                            session_id, ServerTextEvent(text=chunk)
-                        )
-
-                        # Provide binary audio (TTS) as part of pipeline
-                        try:
-                            audio_output_bytes = await manager.tts_provider.synthesize(chunk)
-                            b64_audio = base64.b64encode(audio_output_bytes).decode("utf-8")
-                            await manager.send_event(
-                                session_id, ServerAudioEvent(audio_base64=b64_audio)
-                            )
-                        except Exception as e:
-                            logger.error(f"TTS Synthesis failed: {e}")
-                            # Audio isn't strictly fatal, could just log or send an error event
-                            # depending on strictness requirements.
-
-            except ValidationError as e:
-                # Invalid JSON structure or missing fields
-                await manager.send_event(
-                    session_id, ServerErrorEvent(error=f"Invalid event schema: {str(e)}")
-                )
+                    except Exception as e:
+                        logger.error(f"TTS Synthesis failed: {e}")
+                        # Audio isn't strictly fatal, could just log or send an error event
+                        # depending on strictness requirements.
 
     except WebSocketDisconnect:
         manager.disconnect(session_id)
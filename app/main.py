@@ -26,6 +26,7 @@ from app import protocol
 from app.state import app_state, orchestrator_queue
 from channels.websocket_channel import WebSocketChannel
 from core import observability
+from core.utils.http import close_http_client
 from core.utils.logging import configure_logging, log_error, log_info, log_warning
 from core.speech.sts import sts_service
 
@@ -233,6 +234,7 @@ async def lifespan(app: FastAPI):
             log_warning(__name__, "STS shutdown error: %s", e)
 
         await orchestrator_queue.stop()
+        await close_http_client()
 
         # Close all WebSocket connections via channel
         await ws_channel.disconnect()
@@ -339,14 +341,16 @@ async def speak_text(request: Request):
         return {"ok": True, "mode": mode}
     except Exception as e:
         log_error(__name__, "TTS speak error: %s", e)
-        from fastapi.responses import JSONResponse
+        from fastapi.responses import Response
+
+        from core.speech.sts_models import payload_json
 
         payload, status_code = sts_service.error_payload(
             e,
             backend=str(backend_id or ""),
             default_code="tts_speak_failed",
         )
-        return JSONResponse(content=payload, status_code=status_code)
+        return Response(content=payload_json(payload), media_type="application/json", status_code=status_code)
 
 
 # ── Self-page API ─────────────────────────────────────────────────────────────
@@ -215,7 +215,7 @@ class AppState(BaseModel):
             "events_panel_open": self.events_panel_open,
             "events": [e.to_dict() for e in self.events[-50:]],
             "observability_events": [e.to_dict() for e in self.observability_events[-200:]],
-            "messages": [m.model_dump() for m in self.messages],
+            "messages": [m.to_dict() for m in self.messages],
             "is_processing": self.is_processing,
             "current_query": self.current_query,
             "active_stt_backend": self.active_stt_backend,
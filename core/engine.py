@@ -90,6 +90,9 @@ class Multimodality(BaseModel):
     modality_type: str = Field(description="e.g. 'image'")
     collection: list[Any] = Field(default_factory=list)
 
+    # Resolved image URLs, filled by ``BaseInference.normalize`` on first use.
+    _normalized_cache: list[str] | None = PrivateAttr(default=None)
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # BaseAgent (abstract)
@@ -124,6 +127,7 @@ class BaseAgent(BaseModel):
     _response_instructions: str = PrivateAttr(default="")
     _multimodal_collectors: list[Callable[..., Any]] = PrivateAttr(default_factory=list)
     _inference: Any = PrivateAttr(default=None)
+    _mcp_clients: list[Any] = PrivateAttr(default_factory=list)
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
@@ -301,6 +305,24 @@ class BaseAgent(BaseModel):
             results.append((match.group(1), args))
         return results
 
+    # ── lifecycle ────────────────────────────────────────────────────────
+
+    def attach_mcp_client(self, client: Any) -> None:
+        """Hand an MCP client (from ``initialize_mcp_tools``) to this agent; ``aclose()`` closes it."""
+        if client is not None:
+            self._mcp_clients.append(client)
+
+    async def aclose(self) -> None:
+        """Close the MCP connections held by this agent and its sub-agents."""
+        from .tools import close_mcp_client
+
+        clients, self._mcp_clients = self._mcp_clients, []
+        for client in clients:
+            await close_mcp_client(client)
+        for tool in self.tools:
+            if isinstance(tool, BaseAgent):
+                await tool.aclose()
+
     # ── invoke contract ──────────────────────────────────────────────────
 
     async def invoke(self, query: str) -> Any:
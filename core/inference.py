@@ -13,9 +13,11 @@ import asyncio
 import base64
 import logging
 import os
+import threading
 from typing import Any
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from .responses import BaseResponse
@@ -25,6 +27,22 @@ _DEFAULT_LMS_URL = "http://127.0.0.1:1234/v1"
 
 logger = logging.getLogger(__name__)
 
+# One pooled HTTP client per endpoint, shared by every model served there.
+_HTTP_CLIENTS: dict[str, httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_http_client(base_url: str | None) -> httpx.Client:
+    """Return the endpoint's pooled client, creating it once even when worker threads race here."""
+    key = base_url or "default"
+    if (client := _HTTP_CLIENTS.get(key)) is not None:
+        return client
+    with _HTTP_CLIENTS_LOCK:
+        if (client := _HTTP_CLIENTS.get(key)) is None:
+            client = DefaultHttpxClient(limits=httpx.Limits(max_connections=64, max_keepalive_connections=32))
+            _HTTP_CLIENTS[key] = client
+        return client
+
 
 def _first_non_empty(*values: str | None) -> str | None:
     for value in values:
@@ -93,52 +111,59 @@ class BaseInference(BaseModel):
         except Exception:
             return None
 
-    @staticmethod
-    def _normalize_multimodal(multimodal: Any) -> list[dict]:
-        if not multimodal:
+    @classmethod
+    def _resolve_image_urls(cls, entry: dict) -> list[str]:
+        if entry.get("modality_type") != "image":
             return []
-        items = multimodal if isinstance(multimodal, list) else [multimodal]
-        normalized: list[dict] = []
-        for item in items:
-            if item is None:
+        collection = entry.get("collection") or []
+        if not isinstance(collection, list):
+            collection = [collection]
+
+        urls: list[str] = []
+        for raw in collection:
+            if not isinstance(raw, str) or not raw:
                 continue
-            if isinstance(item, dict):
-                normalized.append(item)
-            elif hasattr(item, "model_dump"):
-                try:
-                    normalized.append(item.model_dump())
-                except Exception:
-                    pass
-            else:
-                modality_type = getattr(item, "modality_type", None)
-                collection = getattr(item, "collection", None)
-                if modality_type is not None:
-                    normalized.append({"modality_type": modality_type, "collection": collection or []})
-        return normalized
+            if raw.startswith(("http://", "https://", "data:")):
+                urls.append(raw)
+            elif file_url := cls._file_to_data_url(raw):
+                urls.append(file_url)
+            elif cls._looks_like_base64(raw):
+                urls.append(f"data:image/png;base64,{raw}")
+        return urls
+
+    @classmethod
+    def _item_image_urls(cls, item: Any) -> list[str]:
+        """Resolve one multimodal item, reusing ``item._normalized_cache`` when the type declares it."""
+        cached = getattr(item, "_normalized_cache", None)
+        if cached is not None:
+            return cached
+
+        if isinstance(item, dict):
+            entry = item
+        elif isinstance(item, BaseModel):
+            try:
+                entry = item.model_dump(mode="python", exclude_none=True)
+            except Exception:
+                return []
+        else:
+            modality_type = getattr(item, "modality_type", None)
+            if modality_type is None:
+                return []
+            entry = {"modality_type": modality_type, "collection": getattr(item, "collection", None) or []}
+
+        urls = cls._resolve_image_urls(entry)
+        if hasattr(item, "_normalized_cache"):
+            item._normalized_cache = urls
+        return urls
 
     def normalize(self, prompt: str, multimodal: Any = None) -> list[dict]:
         content: list[dict[str, Any]] = [{"type": "input_text", "text": prompt}]
-
-        for entry in self._normalize_multimodal(multimodal):
-            if entry.get("modality_type") != "image":
-                continue
-            collection = entry.get("collection") or []
-            if not isinstance(collection, list):
-                collection = [collection]
-
-            for raw in collection:
-                if not isinstance(raw, str) or not raw:
+        if multimodal:
+            items = multimodal if isinstance(multimodal, list) else [multimodal]
+            for item in items:
+                if item is None:
                     continue
-                if raw.startswith(("http://", "https://", "data:")):
-                    image_url = raw
-                elif file_url := self._file_to_data_url(raw):
-                    image_url = file_url
-                elif self._looks_like_base64(raw):
-                    image_url = f"data:image/png;base64,{raw}"
-                else:
-                    continue
-                content.append({"type": "input_image", "image_url": image_url})
-
+                content.extend({"type": "input_image", "image_url": url} for url in self._item_image_urls(item))
         return [{"role": "user", "content": content}]
 
     def _infer(self, input_payload: list[dict], model: str) -> str:
@@ -160,18 +185,42 @@ class BaseInference(BaseModel):
                 multimodal=multimodal,
             )
 
-        input_payload = self.normalize(prompt, multimodal=multimodal)
-        logger.debug("[%s] invoking model=%s prompt_chars=%d", self.provider, model, len(prompt))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] invoking model=%s prompt_chars=%d", self.provider, model, len(prompt))
 
         def _call() -> Any:
+            # Normalization may read image files — keep it off the event loop.
+            input_payload = self.normalize(prompt, multimodal=multimodal)
             text = self._infer(input_payload, model)
-            logger.info("Raw model output (%d chars): %s", len(text), text[:2000])
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Raw model output (%d chars): %s", len(text), text[:2000])
             if response_model and isinstance(response_model, type) and issubclass(response_model, BaseResponse):
                 return response_model.from_raw(text)
             return text
 
         return await asyncio.to_thread(_call)
 
+    async def invoke_batch(
+        self,
+        prompts: list[str],
+        model_id: str | None = None,
+        response_model: type | None = None,
+        multimodal: Any = None,
+    ) -> list[Any]:
+        """Invoke independent prompts concurrently; results keep the input order.
+
+        Requests go out together over the shared connection pool so servers with
+        continuous batching (LM Studio, vLLM) can schedule them in one batch.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.invoke(prompt, model_id=model_id, response_model=response_model, multimodal=multimodal)
+                    for prompt in prompts
+                )
+            )
+        )
+
 
 class OpenAIInference(BaseInference):
     """OpenAI Responses API client for OpenAI-compatible providers."""
@@ -179,7 +228,7 @@ class OpenAIInference(BaseInference):
     _client: OpenAI = PrivateAttr()
 
     def model_post_init(self, __context: Any) -> None:
-        kwargs: dict[str, Any] = {}
+        kwargs: dict[str, Any] = {"http_client": _shared_http_client(self.base_url)}
         if self.base_url:
             kwargs["base_url"] = self.base_url
         if self.api_key:
@@ -230,6 +279,7 @@ def get_implementation(model_id: str | None = None) -> BaseInference:
         return existing
 
     base_url, api_key = _provider_settings(provider)
-    impl = OpenAIInference(provider=provider, model=model, base_url=base_url, api_key=api_key)
+    # Values come from vetted settings — skip validation (model_post_init still runs).
+    impl = OpenAIInference.model_construct(provider=provider, model=model, base_url=base_url, api_key=api_key)
     _IMPLEMENTATIONS[key] = impl
     return impl
@@ -13,16 +13,23 @@ Migration:
 from __future__ import annotations
 
 import warnings
+from typing import TYPE_CHECKING, Any
 
-from channels.base import BaseChannel
+if TYPE_CHECKING:
+    from channels.base import BaseChannel as IntegrationBase
 
-warnings.warn(
-    "core.integrations is deprecated — use channels.base.BaseChannel instead.",
-    DeprecationWarning,
-    stacklevel=2,
-)
+__all__ = ["IntegrationBase"]
 
-# Re-export for backward compat
-IntegrationBase = BaseChannel
 
-__all__ = ["IntegrationBase"]
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so importing this shim neither warns nor pulls in channels/.
+    if name == "IntegrationBase":
+        warnings.warn(
+            "core.integrations is deprecated — use channels.base.BaseChannel instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        from channels.base import BaseChannel
+
+        return BaseChannel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
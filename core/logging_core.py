@@ -31,8 +31,6 @@ def set_logger_level(name: str, level: str | int) -> None:
 
 
 def _format_message(message: str, args: tuple[Any, ...]) -> str:
-    if not args:
-        return message
     try:
         return message % args
     except Exception:
@@ -40,36 +38,36 @@ def _format_message(message: str, args: tuple[Any, ...]) -> str:
         return f"{message} {joined}".strip()
 
 
+def _log(
+    level: int,
+    component: str,
+    message: str,
+    args: tuple[Any, ...],
+    meta: dict[str, Any] | None,
+    exc_info: bool = False,
+) -> None:
+    logger = logging.getLogger(component)
+    if not logger.isEnabledFor(level):
+        return
+    payload = _format_message(message, args) if args else message
+    logger.log(level, f"{payload} | meta={meta}" if meta else payload, exc_info=exc_info)
+
+
 def log_debug(component: str, message: str, *args: Any, meta: dict[str, Any] | None = None) -> None:
-    payload = _format_message(message, args)
-    if meta:
-        payload = f"{payload} | meta={meta}"
-    logging.getLogger(component).debug(payload)
+    _log(logging.DEBUG, component, message, args, meta)
 
 
 def log_info(component: str, message: str, *args: Any, meta: dict[str, Any] | None = None) -> None:
-    payload = _format_message(message, args)
-    if meta:
-        payload = f"{payload} | meta={meta}"
-    logging.getLogger(component).info(payload)
+    _log(logging.INFO, component, message, args, meta)
 
 
 def log_warning(component: str, message: str, *args: Any, meta: dict[str, Any] | None = None) -> None:
-    payload = _format_message(message, args)
-    if meta:
-        payload = f"{payload} | meta={meta}"
-    logging.getLogger(component).warning(payload)
+    _log(logging.WARNING, component, message, args, meta)
 
 
 def log_error(component: str, message: str, *args: Any, meta: dict[str, Any] | None = None) -> None:
-    payload = _format_message(message, args)
-    if meta:
-        payload = f"{payload} | meta={meta}"
-    logging.getLogger(component).error(payload)
+    _log(logging.ERROR, component, message, args, meta)
 
 
 def log_exception(component: str, message: str, *args: Any, meta: dict[str, Any] | None = None) -> None:
-    payload = _format_message(message, args)
-    if meta:
-        payload = f"{payload} | meta={meta}"
-    logging.getLogger(component).exception(payload)
+    _log(logging.ERROR, component, message, args, meta, exc_info=True)
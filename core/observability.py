@@ -10,17 +10,25 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import secrets
 import threading
 import time
 from collections import deque
 from contextlib import contextmanager
 from contextvars import ContextVar
-from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 from typing import Any, Callable, Iterable
-from uuid import uuid4
+
+from core.utils.helpers import env_bool
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup (``perf`` extra)
+    _orjson = None
 
 # ── internal state ───────────────────────────────────────────────────────────
 
@@ -28,10 +36,29 @@ _TRACE_ID: ContextVar[str | None] = ContextVar("trace_id", default=None)
 _EVENT_SEQ = 0
 _LOCK = threading.Lock()
 _SINKS: list[Callable[[dict], None]] = []
+# Event ids: a random per-process prefix plus a counter. The log outlives processes (and PIDs are
+# reused), so the prefix — not the PID — keeps ids unique across restarts and forked workers.
+_EVT_CTR = itertools.count(1).__next__
+_EVT_PREFIX = secrets.token_hex(4)
+
+
+def _reseed_event_ids() -> None:
+    global _EVT_CTR, _EVT_PREFIX
+    _EVT_CTR = itertools.count(1).__next__
+    _EVT_PREFIX = secrets.token_hex(4)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(sec)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{rem // 1000:06d}Z"
+    )
 
 
 def _next_seq() -> int:
@@ -41,10 +68,13 @@ def _next_seq() -> int:
         return _EVENT_SEQ
 
 
-def _ensure_log_path() -> Path:
+@cache
+def _settings() -> tuple[bool, int, Path]:
+    """Resolve env-derived settings once — ``(enabled, max_detail, log_path)``."""
+    enabled = env_bool("OBSERVABILITY_ENABLED", True)
+    max_len = int(os.getenv("OBSERVABILITY_MAX_DETAIL", "2000"))
     path = Path(os.getenv("OBSERVABILITY_LOG_PATH", "data/observability.jsonl"))
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return enabled, max_len, path
 
 
 def _truncate(text: str | None, max_len: int) -> str | None:
@@ -72,17 +102,41 @@ def _sanitize(value: Any, max_len: int) -> Any:
         return _truncate(str(value), max_len)
 
 
+def _event_line(event: dict) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(event, option=_orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. ints beyond 64 bits — let the stdlib encoder handle it
+            pass
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def _write_event(event: dict) -> None:
-    path = _ensure_log_path()
-    line = json.dumps(event, ensure_ascii=False)
+    path = _settings()[2]
+    line = _event_line(event)
     with _LOCK:
-        with path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        try:
+            f = path.open("ab")
+        except FileNotFoundError:  # first event, or the directory was removed while running
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = path.open("ab")
+        with f:
+            f.write(line)
 
 
 # ── public API ───────────────────────────────────────────────────────────────
 
 
+def reload_observability_config() -> None:
+    """Re-read ``OBSERVABILITY_*`` env vars on the next event (tests, hot reconfig)."""
+    _settings.cache_clear()
+
+
+def is_enabled() -> bool:
+    """Cheap guard so callers can skip building expensive event payloads."""
+    return _settings()[0]
+
+
 def register_sink(sink: Callable[[dict], None]) -> None:
     """Register a callback that receives every event dict."""
     if sink not in _SINKS:
@@ -99,7 +153,7 @@ def current_trace_id() -> str | None:
 
 
 def new_trace_id() -> str:
-    return f"trc_{uuid4().hex}"
+    return f"trc_{secrets.token_hex(16)}"
 
 
 def log_event(
@@ -110,19 +164,26 @@ def log_event(
     trace_id: str | None = None,
     status: str | None = None,
     meta: dict | None = None,
+    meta_factory: Callable[[], dict] | None = None,
 ) -> dict | None:
     """Append an observability event to the JSONL log and fan out to sinks.
 
+    ``meta_factory`` builds ``meta`` lazily — it is only called when the event is recorded.
     This function **never** raises — observability must not break the app.
     """
-    if os.getenv("OBSERVABILITY_ENABLED", "true").lower() not in ("true", "1", "yes"):
+    enabled, max_len, _ = _settings()
+    if not enabled:
         return None
+    if meta_factory is not None:
+        try:
+            meta = meta_factory()
+        except Exception:
+            meta = None
 
     trace = trace_id or _TRACE_ID.get()
-    max_len = int(os.getenv("OBSERVABILITY_MAX_DETAIL", "2000"))
 
     event: dict[str, Any] = {
-        "id": f"evt_{uuid4().hex[:12]}",
+        "id": f"evt_{_EVT_PREFIX}{_EVT_CTR():08x}",
         "seq": _next_seq(),
         "ts": _utc_now_iso(),
         "type": event_type,
@@ -183,7 +244,7 @@ def trace_scope(agent: str, query: str | None = None, meta: dict | None = None)
 
 def read_recent_events(limit: int = 200) -> list[dict]:
     """Read the most recent events from the JSONL log file."""
-    path = Path(os.getenv("OBSERVABILITY_LOG_PATH", "data/observability.jsonl"))
+    path = _settings()[2]
     if not path.exists():
         return []
 
@@ -197,10 +258,11 @@ def read_recent_events(limit: int = 200) -> list[dict]:
     except Exception:
         return []
 
+    loads = _orjson.loads if _orjson is not None else json.loads
     events: list[dict] = []
     for line in lines:
         try:
-            events.append(json.loads(line))
+            events.append(loads(line))
         except Exception:
             continue
     return events
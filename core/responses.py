@@ -9,12 +9,42 @@ Hierarchy:
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Any, Literal, get_origin
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, ClassVar, Literal, get_origin
 
 from pydantic import BaseModel, Field, model_validator
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup (``perf`` extra)
+    from json import loads as _json_loads
+
+_TOON_LEADING_BULLET = re.compile(r"^[-*]+\s*")
+_TOON_LEADING_NUM = re.compile(r"^\d+\.\s*")
+_TOON_INDEXED_KEY = re.compile(r"^(\w+)\[(\d+)\]$")
+_LIST_LINE_PREFIX = re.compile(r"^\s*(\d+\.|\-|\*)\s*")
+_TOON_KEY_ALIASES = {"tool": "response"}
+# Any line holding a colon: group 1 is the text before the first colon, group 2 the rest.
+_TOON_COLON_LINE = re.compile(r"(?m)^([^:\n]*):(.*)$")
+_TOON_OTHER_LINE_BREAKS = re.compile(r"[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _describe_type(annotation: Any) -> str:
+    if get_origin(annotation) is list:
+        return "list"
+    if annotation is str:
+        return "string"
+    if hasattr(annotation, "__args__"):
+        return " | ".join(str(a) for a in annotation.__args__)
+    return str(annotation)
+
+
+@cache
+def _cached_instructions(model_cls: type[BaseResponse], fmt: str) -> str:
+    return model_cls._build_instructions(fmt)
+
 
 class BaseResponse(BaseModel):
     """Base structured response with multi-format parsing.
@@ -23,36 +53,40 @@ class BaseResponse(BaseModel):
     generation are fully inherited.
     """
 
+    # Per-class field metadata, filled once when the subclass is created.
+    _known_fields: ClassVar[frozenset[str]] = frozenset()
+    _field_type_strs: ClassVar[dict[str, str]] = {}
+    _list_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._known_fields = frozenset(cls.model_fields)
+        cls._field_type_strs = {name: _describe_type(f.annotation) for name, f in cls.model_fields.items()}
+        cls._list_fields = tuple(name for name, f in cls.model_fields.items() if get_origin(f.annotation) is list)
+
     # ── shared helpers ───────────────────────────────────────────────────
 
     @staticmethod
     def _strip_wrapping_quotes(value: str) -> str:
         text = value.strip()
-        if len(text) >= 2 and text[0] == text[-1] and text[0] in ("'", '"'):
+        if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
             return text[1:-1]
-        return value
+        return text
 
     # ── instruction generation ───────────────────────────────────────────
 
     @classmethod
     def get_instructions(cls, fmt: str = "json") -> str:
-        """Generate response-format instructions for inclusion in prompts."""
-        fields_doc = []
-        for name, field in cls.model_fields.items():
-            desc = field.description or ""
-            annotation = field.annotation
-            origin = get_origin(annotation)
-            if origin is list:
-                type_str = "list"
-            elif annotation is str:
-                type_str = "string"
-            elif hasattr(annotation, "__args__"):
-                type_str = " | ".join(str(a) for a in annotation.__args__)
-            else:
-                type_str = str(annotation)
-            fields_doc.append(f"- **{name}** ({type_str}): {desc}")
+        """Generate response-format instructions for inclusion in prompts (cached per class + format)."""
+        return _cached_instructions(cls, fmt)
 
-        fields_text = "\n".join(fields_doc)
+    @classmethod
+    def _build_instructions(cls, fmt: str) -> str:
+        type_strs = cls._field_type_strs
+        fields_text = "\n".join(
+            f"- **{name}** ({type_strs[name]}): {field.description or ''}" for name, field in cls.model_fields.items()
+        )
         field_names = list(cls.model_fields.keys())
 
         if fmt == "json":
@@ -107,54 +141,56 @@ class BaseResponse(BaseModel):
 
     @staticmethod
     def _extract_json_object(text: str) -> str:
+        # Hop between brace positions with str.find instead of visiting every character.
         depth, start = 0, -1
-        for i, ch in enumerate(text):
-            if ch == "{":
+        next_open, next_close = text.find("{"), text.find("}")
+        while next_open >= 0 or next_close >= 0:
+            if next_close < 0 or 0 <= next_open < next_close:
                 if depth == 0:
-                    start = i
+                    start = next_open
                 depth += 1
-            elif ch == "}":
+                next_open = text.find("{", next_open + 1)
+            else:
                 depth -= 1
                 if depth == 0 and start >= 0:
-                    return text[start : i + 1]
+                    return text[start : next_close + 1]
+                next_close = text.find("}", next_close + 1)
         raise ValueError("No JSON object found")
 
     @staticmethod
     def _clean_toon_key(raw: str) -> str:
         k = raw.strip()
-        k = re.sub(r"^[-*]+\s*", "", k)
-        k = re.sub(r"^\d+\.\s*", "", k)
+        k = _TOON_LEADING_BULLET.sub("", k)
+        k = _TOON_LEADING_NUM.sub("", k)
         return k.strip("*").strip().lower()
 
     def _parse_toon(self, text: str) -> dict:
-        """Two-pass key-aware TOON parser."""
-        known_fields = set(self.__class__.model_fields.keys())
-        aliases = {"tool": "response"}
-        lines = text.splitlines()
-
-        # Pass 1 — find field start positions
-        field_starts: list[tuple[int, str, str]] = []
-        for idx, line in enumerate(lines):
-            stripped = line.strip()
-            if ":" not in stripped:
-                continue
-            raw_key, _, val = stripped.partition(":")
-            cleaned = self._clean_toon_key(raw_key)
-            cleaned = aliases.get(cleaned, cleaned)
-            if cleaned in known_fields:
-                field_starts.append((idx, cleaned, val.strip()))
+        """Key-aware TOON parser — regex-located field headers, sliced value bodies."""
+        known_fields = self._known_fields
+        aliases = _TOON_KEY_ALIASES
 
-        if not field_starts:
-            return {}
+        # Normalize exotic line boundaries so "\n" is the only separator left.
+        if _TOON_OTHER_LINE_BREAKS.search(text):
+            text = "\n".join(text.splitlines())
 
-        # Pass 2 — extract values between field boundaries
         data: dict[str, Any] = {}
-        for i, (start_idx, field_name, first_val) in enumerate(field_starts):
-            end_idx = field_starts[i + 1][0] if i + 1 < len(field_starts) else len(lines)
-            value_parts = [first_val] if first_val else []
-            value_parts.extend(lines[start_idx + 1 : end_idx])
-            value = "\n".join(value_parts).strip()
-            self._set_toon_value(data, field_name, value)
+        current_field: str | None = None
+        value_start = 0
+        first_val = ""
+        for match in _TOON_COLON_LINE.finditer(text):
+            cleaned = self._clean_toon_key(match.group(1))
+            cleaned = aliases.get(cleaned, cleaned)
+            if cleaned not in known_fields:
+                continue
+            if current_field is not None:
+                self._set_toon_value(data, current_field, (first_val + text[value_start : match.start()]).strip())
+            current_field = cleaned
+            first_val = match.group(2).strip()
+            value_start = match.end()
+
+        if current_field is None:
+            return {}
+        self._set_toon_value(data, current_field, (first_val + text[value_start:]).strip())
 
         # Coerce any invalid action value to "tool".
         # Handles patterns like "action: web_search" (bare tool name) as well as
@@ -177,6 +213,12 @@ class BaseResponse(BaseModel):
         inner = value[1:-1].strip()
         if not inner:
             return []
+        if not any(ch in inner for ch in "({[)}]"):
+            # Flat list — let str.split do the work; a trailing comma adds no item.
+            parts = inner.split(",")
+            if not parts[-1]:
+                parts.pop()
+            return [part.strip() for part in parts]
         items: list[str] = []
         current: list[str] = []
         depth = 0
@@ -201,7 +243,7 @@ class BaseResponse(BaseModel):
         if bracket_list is not None:
             data[key] = bracket_list
             return
-        match = re.match(r"^(\w+)\[(\d+)\]$", key)
+        match = _TOON_INDEXED_KEY.match(key)
         if match:
             base_key, idx = match.group(1), int(match.group(2))
             lst = data.setdefault(base_key, [])
@@ -211,20 +253,21 @@ class BaseResponse(BaseModel):
         else:
             data[key] = value
 
-    def _coerce_list_fields(self, data: dict, model_cls: type) -> dict:
-        coerced = dict(data)
-        for field_name, field in model_cls.model_fields.items():
-            if get_origin(field.annotation) is not list:
-                continue
-            value = coerced.get(field_name)
+    def _coerce_list_fields(self, data: dict, model_cls: type[BaseResponse]) -> dict:
+        # Copy only when a list field actually holds a string; already-list values pass through.
+        coerced = data
+        for field_name in model_cls._list_fields:
+            value = data.get(field_name)
             if not isinstance(value, str):
                 continue
+            if coerced is data:
+                coerced = dict(data)
             parsed = self._parse_bracket_list(value)
             if parsed is not None:
                 coerced[field_name] = parsed
             else:
                 lines = [ln.strip() for ln in value.splitlines() if ln.strip()]
-                coerced[field_name] = [re.sub(r"^\s*(\d+\.|\-|\*)\s*", "", ln).strip() for ln in lines]
+                coerced[field_name] = [_LIST_LINE_PREFIX.sub("", ln).strip() for ln in lines]
         return coerced
 
     # ── public parser ────────────────────────────────────────────────────
@@ -244,25 +287,25 @@ class BaseResponse(BaseModel):
 
         instance = cls.model_construct()
 
-        # JSON
-        try:
-            json_str = instance._extract_json_object(raw)
-            data = json.loads(json_str)
-            if set(cls.model_fields.keys()) & set(data.keys()):
-                return cls.model_validate(data)
-        except Exception:
-            pass
-
-        # TOON
-        try:
-            data = instance._parse_toon(raw)
-            if data:
-                try:
+        # JSON — needs at least one "{"
+        if "{" in raw:
+            try:
+                json_str = instance._extract_json_object(raw)
+                data = _json_loads(json_str)
+                if not cls._known_fields.isdisjoint(data):
                     return cls.model_validate(data)
-                except Exception:
+            except Exception:
+                pass
+
+        # TOON — needs at least one "field: value" separator; list fields are
+        # pre-coerced so exactly one model_validate runs.
+        if ":" in raw:
+            try:
+                data = instance._parse_toon(raw)
+                if data:
                     return cls.model_validate(instance._coerce_list_fields(data, cls))
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         # Fallback
         fallback = {"response": raw.strip()} if "response" in cls.model_fields else {}
@@ -311,8 +354,12 @@ class ReActResponse(BaseResponse):
         return self
 
 
-class Message(BaseModel):
+@dataclass(slots=True)
+class Message:
     """A single message in the conversation history."""
 
     role: Literal["system", "user", "assistant"]
     content: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {"role": self.role, "content": self.content}
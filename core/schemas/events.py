@@ -1,7 +1,7 @@
+import json
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Dict, Literal, Optional, Union, Annotated
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Literal, Optional, Union
 
 
 class ClientEventType(str, Enum):
@@ -10,30 +10,60 @@ class ClientEventType(str, Enum):
     SYSTEM = "system"
 
 
-class BaseClientEvent(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BaseClientEvent:
     session_id: str
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ClientTextEvent(BaseClientEvent):
-    type: Literal[ClientEventType.TEXT] = ClientEventType.TEXT
     text: str
+    type: Literal[ClientEventType.TEXT] = field(default=ClientEventType.TEXT, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ClientAudioEvent(BaseClientEvent):
-    type: Literal[ClientEventType.AUDIO] = ClientEventType.AUDIO
     audio_base64: str
+    type: Literal[ClientEventType.AUDIO] = field(default=ClientEventType.AUDIO, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ClientSystemEvent(BaseClientEvent):
-    type: Literal[ClientEventType.SYSTEM] = ClientEventType.SYSTEM
     command: str
     payload: Optional[Dict[str, Any]] = None
+    type: Literal[ClientEventType.SYSTEM] = field(default=ClientEventType.SYSTEM, init=False)
+
+
+ClientEvent = Union[ClientTextEvent, ClientAudioEvent, ClientSystemEvent]
+
+_CLIENT_EVENT_TYPES: Dict[ClientEventType, type] = {
+    ClientEventType.TEXT: ClientTextEvent,
+    ClientEventType.AUDIO: ClientAudioEvent,
+    ClientEventType.SYSTEM: ClientSystemEvent,
+}
+
+# String-typed fields checked by parse_client_event.
+_STR_FIELDS = ("session_id", "text", "audio_base64", "command")
 
 
-ClientEvent = Annotated[
-    Union[ClientTextEvent, ClientAudioEvent, ClientSystemEvent], Field(discriminator="type")
-]
+def parse_client_event(payload: Dict[str, Any]) -> ClientEvent:
+    """Dispatch a decoded client payload on its ``type``; raises ``ValueError`` on bad input."""
+    if not isinstance(payload, dict):
+        raise ValueError("Client event must be a JSON object")
+    data = dict(payload)
+    try:
+        event_cls = _CLIENT_EVENT_TYPES[ClientEventType(data.pop("type"))]
+    except (KeyError, ValueError) as exc:
+        raise ValueError(f"Unknown or missing event type: {payload.get('type')!r}") from exc
+    for name in _STR_FIELDS:
+        if name in data and not isinstance(data[name], str):
+            raise ValueError(f"Field {name!r} must be a string")
+    if data.get("payload") is not None and not isinstance(data["payload"], dict):
+        raise ValueError("Field 'payload' must be an object")
+    try:
+        return event_cls(**data)
+    except TypeError as exc:
+        raise ValueError(str(exc)) from exc
 
 
 class ServerEventType(str, Enum):
@@ -44,39 +74,41 @@ class ServerEventType(str, Enum):
     ERROR = "error"
 
 
-class BaseServerEvent(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    pass
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BaseServerEvent:
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ServerStatusEvent(BaseServerEvent):
-    type: Literal[ServerEventType.STATUS] = ServerEventType.STATUS
     status: str  # e.g., "thinking", "tool_running"
     details: Optional[Dict[str, Any]] = None
+    type: Literal[ServerEventType.STATUS] = field(default=ServerEventType.STATUS, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ServerTokenEvent(BaseServerEvent):
-    type: Literal[ServerEventType.TOKEN] = ServerEventType.TOKEN
     token: str
+    type: Literal[ServerEventType.TOKEN] = field(default=ServerEventType.TOKEN, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ServerTextEvent(BaseServerEvent):
-    type: Literal[ServerEventType.TEXT] = ServerEventType.TEXT
     text: str
+    type: Literal[ServerEventType.TEXT] = field(default=ServerEventType.TEXT, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ServerAudioEvent(BaseServerEvent):
-    type: Literal[ServerEventType.AUDIO] = ServerEventType.AUDIO
     audio_base64: str
+    type: Literal[ServerEventType.AUDIO] = field(default=ServerEventType.AUDIO, init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ServerErrorEvent(BaseServerEvent):
-    type: Literal[ServerEventType.ERROR] = ServerEventType.ERROR
     error: str
+    type: Literal[ServerEventType.ERROR] = field(default=ServerEventType.ERROR, init=False)
 
 
-# Create the union type for parsing/dumping
-ServerEvent = Annotated[
-    Union[ServerStatusEvent, ServerTokenEvent, ServerTextEvent, ServerAudioEvent, ServerErrorEvent],
-    Field(discriminator="type"),
-]
+ServerEvent = Union[ServerStatusEvent, ServerTokenEvent, ServerTextEvent, ServerAudioEvent, ServerErrorEvent]
@@ -5,8 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from pydantic import Field, PrivateAttr
 
@@ -19,6 +20,9 @@ from core.utils.helpers import compact_reason
 
 logger = logging.getLogger(__name__)
 
+# A sentence is complete once terminal punctuation is followed by whitespace.
+_SENTENCE_END = re.compile(r"[.!?]\s+")
+
 
 class STSService(RuntimeObject):
     """Pipeline facade: STT → LLM → TTS.
@@ -41,9 +45,8 @@ class STSService(RuntimeObject):
         return self._shutdown_services()
 
     async def _initialize_services(self) -> None:
-        await self._verify_local_asr_model()
-        await self.stt.initialize()
-        await self.tts.initialize()
+        # Independent subsystems — overlap model checks, downloads and warmup.
+        await asyncio.gather(self._verify_local_asr_model(), self.stt.initialize(), self.tts.initialize())
         self._model_status.update(
             {f"tts::{bid}": dict(payload) for bid, payload in self.tts.get_model_status().items()}
         )
@@ -72,12 +75,26 @@ class STSService(RuntimeObject):
         self._model_status["qwen3_asr"] = {"path": str(path), "exists": exists}
         if exists:
             logger.info("Local model verified: qwen3_asr -> %s", path)
+            if active_backend == "qwen3_asr":
+                await self._warm_local_asr_model()
         else:
             logger.warning(
                 "Local model NOT found: %s (set QWEN3_ASR_MODEL or switch to whisper_api/macos_native_bridge)", path
             )
         observability.log_event("sts_model_verification", agent="sts", meta={"models": dict(self._model_status)})
 
+    async def _warm_local_asr_model(self) -> None:
+        """Load Qwen3-ASR and run its throwaway inference so the first request pays neither."""
+        from experimental.qwen3_asr import warmup
+
+        try:
+            await asyncio.to_thread(warmup)
+        except Exception as exc:  # the first request retries the load and surfaces a structured error
+            logger.warning("Qwen3-ASR warmup failed: %s", exc)
+            self._model_status["qwen3_asr"]["warm"] = False
+        else:
+            self._model_status["qwen3_asr"]["warm"] = True
+
     def get_model_status(self) -> dict[str, dict[str, Any]]:
         return dict(self._model_status)
 
@@ -143,8 +160,14 @@ class STSService(RuntimeObject):
         model_name: str | None = None,
         tts_voice: str | None = None,
         orchestrator_fn: Callable[[str], Awaitable[str]] | None = None,
+        orchestrator_stream_fn: Callable[[str], AsyncIterator[str]] | None = None,
         auto_speak: bool = True,
     ) -> dict[str, Any]:
+        """Run STT → LLM → TTS.
+
+        With ``orchestrator_stream_fn`` the LLM output is consumed incrementally and
+        each completed sentence is synthesized while later tokens are still arriving.
+        """
         stages: dict[str, Any] = {}
 
         transcribed = await self.stt.transcribe_with_metadata(
@@ -166,6 +189,16 @@ class STSService(RuntimeObject):
                 "error": "Empty transcription - no audio content detected.",
             }
 
+        if orchestrator_stream_fn is not None:
+            return await self._process_streamed_response(
+                transcript,
+                orchestrator_stream_fn,
+                stages=stages,
+                tts_backend=tts_backend,
+                tts_voice=tts_voice,
+                auto_speak=auto_speak,
+            )
+
         response = ""
         if orchestrator_fn is not None:
             try:
@@ -193,6 +226,79 @@ class STSService(RuntimeObject):
             "stages": stages,
         }
 
+    async def _process_streamed_response(
+        self,
+        transcript: str,
+        stream_fn: Callable[[str], AsyncIterator[str]],
+        *,
+        stages: dict[str, Any],
+        tts_backend: str | None,
+        tts_voice: str | None,
+        auto_speak: bool,
+    ) -> dict[str, Any]:
+        # Sentences are spoken strictly in order by a single consumer task, so
+        # local playback never overlaps while the LLM keeps generating.
+        sentences: asyncio.Queue[str | None] = asyncio.Queue()
+        segments: list[bytes] = []
+        tts_mode: str | None = None
+
+        async def _speak_sentences() -> None:
+            nonlocal tts_mode
+            while (sentence := await sentences.get()) is not None:
+                try:
+                    tts_mode, audio = await self.tts.speak(sentence, backend=tts_backend, voice=tts_voice)
+                except Exception as exc:
+                    logger.error("STS pipeline TTS error: %s", exc)
+                    stages["tts_error"] = str(exc)
+                    continue
+                if audio:
+                    segments.append(audio)
+
+        speaker = asyncio.create_task(_speak_sentences()) if auto_speak else None
+        parts: list[str] = []
+        pending = ""
+        try:
+            async for chunk in stream_fn(transcript):
+                parts.append(chunk)
+                pending += chunk
+                while match := _SENTENCE_END.search(pending):
+                    sentence, pending = pending[: match.end()].strip(), pending[match.end() :]
+                    if speaker is not None and sentence:
+                        sentences.put_nowait(sentence)
+        except asyncio.CancelledError:
+            if speaker is not None:
+                speaker.cancel()
+            raise
+        except Exception as exc:
+            logger.error("STS pipeline LLM error: %s", exc)
+            apology = f" Sorry, something went wrong: {exc}"
+            parts.append(apology)
+            pending += apology
+
+        if speaker is not None:
+            if pending.strip():
+                sentences.put_nowait(pending.strip())
+            sentences.put_nowait(None)
+            await speaker
+
+        response = "".join(parts).strip()
+        stages["llm"] = {"response": response, "streamed": True}
+        if speaker is not None:
+            stages["tts"] = {
+                "mode": tts_mode,
+                "backend": tts_backend or self.tts.default_tts_backend(),
+                "segments": len(segments),
+            }
+
+        return {
+            "transcript": transcript,
+            "response": response,
+            "tts_mode": tts_mode,
+            "tts_audio_bytes": segments[0] if len(segments) == 1 else None,
+            "tts_audio_segments": segments,
+            "stages": stages,
+        }
+
 
 sts_service = STSService()
 
@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import shutil
 import subprocess
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from core.speech.sts_models import AudioFormatModel, AudioProbeModel, AudioTrackModel, STSBackendError
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup (``perf`` extra)
+    from json import loads as _json_loads
+
+# Uploads are piped to ffprobe as-is — any buffer-protocol object, no defensive copy.
+AudioBuffer = bytes | bytearray | memoryview
+
+# Async stdin writes go out in bounded slices so the transport never buffers a second full copy.
+_PIPE_CHUNK = 64 * 1024
+
+# Upper bound for one ffprobe run — a hung probe must not pin a request (or leak a child) forever.
+_FFPROBE_TIMEOUT_S = 30.0
+
+# ISO-BMFF containers (MP4/M4A/MOV — iOS/Safari recordings) often put their ``moov`` index at the end,
+# which ffprobe can only reach by seeking; those are probed from a temp file instead of a pipe.
+_SEEKABLE_SUFFIXES = frozenset((".mp4", ".m4a", ".m4b", ".mov", ".3gp", ".3g2"))
+# Failures worth retrying from a file — not a missing or unrunnable ffprobe.
+_PIPE_RETRY_CODES = frozenset(("ffprobe_failed", "ffprobe_empty_output", "ffprobe_parse_error"))
+
 
 def ensure_ffprobe_available() -> str:
     """Return ffprobe executable path or raise structured setup error."""
-    exe = os.getenv("STS_FFPROBE_BIN", "ffprobe").strip()
+    return _resolve_ffprobe(os.getenv("STS_FFPROBE_BIN", "ffprobe").strip())
+
+
+@lru_cache(maxsize=8)
+def _resolve_ffprobe(exe: str) -> str:
+    # Only successful lookups are cached — a missing binary is re-checked next call.
     found = shutil.which(exe)
     if not found:
         raise STSBackendError(
@@ -28,6 +56,11 @@ def ensure_ffprobe_available() -> str:
     return found
 
 
+def invalidate_ffprobe_cache() -> None:
+    """Forget resolved ffprobe paths (e.g. after PATH or ``STS_FFPROBE_BIN`` changes)."""
+    _resolve_ffprobe.cache_clear()
+
+
 def _as_int(value: Any) -> int | None:
     if value is None:
         return None
@@ -46,40 +79,47 @@ def _as_float(value: Any) -> float | None:
         return None
 
 
-def _run_ffprobe(path: Path) -> dict[str, Any]:
-    ffprobe = ensure_ffprobe_available()
-    cmd = [
-        ffprobe,
+def _ffprobe_cmd(source: Path | AudioBuffer) -> list[str]:
+    return [
+        ensure_ffprobe_available(),
         "-v",
         "error",
         "-print_format",
         "json",
         "-show_streams",
         "-show_format",
-        str(path),
+        str(source) if isinstance(source, Path) else "pipe:0",
     ]
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except Exception as exc:
-        raise STSBackendError(
-            error_code="ffprobe_execution_error",
-            error_message=str(exc),
-            backend="sts",
-            remediation="Verify FFprobe installation and runtime permissions.",
-            status_code=503,
-        ) from exc
 
-    stdout = (proc.stdout or "").strip()
-    stderr = (proc.stderr or "").strip()
-    if proc.returncode != 0:
+
+def _execution_error(exc: Exception) -> STSBackendError:
+    return STSBackendError(
+        error_code="ffprobe_execution_error",
+        error_message=str(exc),
+        backend="sts",
+        remediation="Verify FFprobe installation and runtime permissions.",
+        status_code=503,
+    )
+
+
+def _timeout_error() -> STSBackendError:
+    return STSBackendError(
+        error_code="ffprobe_timeout",
+        error_message=f"FFprobe did not finish within {_FFPROBE_TIMEOUT_S:.0f}s.",
+        backend="sts",
+        remediation="Retry with a shorter or valid audio file.",
+        status_code=504,
+    )
+
+
+def _decode_ffprobe_output(returncode: int | None, raw_stdout: bytes | None, raw_stderr: bytes | None) -> dict[str, Any]:
+    stdout = (raw_stdout or b"").strip()
+    if returncode != 0:
+        stderr = (raw_stderr or b"").decode("utf-8", errors="replace").strip()
+        detail = stderr or stdout.decode("utf-8", errors="replace") or f"exit {returncode}"
         raise STSBackendError(
             error_code="ffprobe_failed",
-            error_message=f"FFprobe failed: {stderr or stdout or f'exit {proc.returncode}'}",
+            error_message=f"FFprobe failed: {detail}",
             backend="sts",
             remediation="Verify the uploaded audio format is supported by FFprobe.",
             status_code=422,
@@ -93,8 +133,8 @@ def _run_ffprobe(path: Path) -> dict[str, Any]:
             status_code=422,
         )
     try:
-        return json.loads(stdout)
-    except json.JSONDecodeError as exc:
+        return _json_loads(stdout)
+    except ValueError as exc:
         raise STSBackendError(
             error_code="ffprobe_parse_error",
             error_message=f"Invalid ffprobe JSON output: {exc}",
@@ -104,6 +144,71 @@ def _run_ffprobe(path: Path) -> dict[str, Any]:
         ) from exc
 
 
+def _run_ffprobe(source: Path | AudioBuffer) -> dict[str, Any]:
+    """Run ffprobe on a file path, or on in-memory bytes fed through stdin."""
+    cmd = _ffprobe_cmd(source)
+    try:
+        # ``communicate`` already writes the buffer through a memoryview in pipe-sized chunks.
+        proc = subprocess.run(
+            cmd,
+            input=None if isinstance(source, Path) else source,
+            capture_output=True,
+            check=False,
+            timeout=_FFPROBE_TIMEOUT_S,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise _timeout_error() from exc
+    except Exception as exc:
+        raise _execution_error(exc) from exc
+    return _decode_ffprobe_output(proc.returncode, proc.stdout, proc.stderr)
+
+
+async def _feed_stdin(stdin: asyncio.StreamWriter, payload: AudioBuffer) -> None:
+    view = memoryview(payload)
+    try:
+        for offset in range(0, view.nbytes, _PIPE_CHUNK):
+            stdin.write(view[offset : offset + _PIPE_CHUNK])
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # ffprobe may stop reading once it has seen enough of the stream
+    finally:
+        stdin.close()
+
+
+async def _run_ffprobe_async(source: Path | AudioBuffer) -> dict[str, Any]:
+    """Event-loop friendly variant of ``_run_ffprobe``."""
+    cmd = _ffprobe_cmd(source)
+    from_stdin = not isinstance(source, Path)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if from_stdin else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except Exception as exc:
+        raise _execution_error(exc) from exc
+    try:
+        async with asyncio.timeout(_FFPROBE_TIMEOUT_S):
+            if from_stdin:
+                _, stdout, stderr = await asyncio.gather(
+                    _feed_stdin(proc.stdin, source), proc.stdout.read(), proc.stderr.read()
+                )
+                await proc.wait()
+            else:
+                stdout, stderr = await proc.communicate()
+    except TimeoutError as exc:
+        raise _timeout_error() from exc
+    except Exception as exc:
+        raise _execution_error(exc) from exc
+    finally:
+        # Cancelled, timed out or failed mid-run — never leave the child orphaned.
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    return _decode_ffprobe_output(proc.returncode, stdout, stderr)
+
+
 def _parse_probe(payload: dict[str, Any]) -> AudioProbeModel:
     streams = payload.get("streams") or []
     parsed_tracks: list[AudioTrackModel] = []
@@ -149,16 +254,67 @@ def probe_audio_path(path: Path | str, required: bool = True) -> AudioProbeModel
         return AudioProbeModel()
 
 
-def probe_audio_bytes(audio_bytes: bytes, filename: str = "audio.webm", required: bool = True) -> AudioProbeModel:
-    """Probe in-memory audio bytes by writing to a temporary file first."""
-    suffix = Path(filename).suffix or ".webm"
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+def _needs_seekable_input(audio_bytes: AudioBuffer, filename: str) -> bool:
+    return bytes(memoryview(audio_bytes)[4:8]) == b"ftyp" or Path(filename).suffix.lower() in _SEEKABLE_SUFFIXES
+
+
+@contextmanager
+def _temp_audio_file(audio_bytes: AudioBuffer, filename: str) -> Iterator[Path]:
+    with tempfile.NamedTemporaryFile(suffix=Path(filename).suffix or ".webm", delete=False) as tmp:
         tmp.write(audio_bytes)
         tmp_path = Path(tmp.name)
     try:
-        return probe_audio_path(tmp_path, required=required)
+        yield tmp_path
     finally:
-        try:
-            tmp_path.unlink()
-        except Exception:
-            pass
+        tmp_path.unlink(missing_ok=True)
+
+
+def _with_upload_metadata(probe: AudioProbeModel, audio_bytes: AudioBuffer, filename: str) -> AudioProbeModel:
+    # ffprobe reports "pipe:0" for stdin input — restore the upload's own name.
+    if probe.audio_format is not None:
+        probe.audio_format.filename = filename
+        if probe.audio_format.size_bytes is None:
+            probe.audio_format.size_bytes = memoryview(audio_bytes).nbytes
+    return probe
+
+
+def probe_audio_bytes(audio_bytes: AudioBuffer, filename: str = "audio.webm", required: bool = True) -> AudioProbeModel:
+    """Probe in-memory audio bytes — through ffprobe's stdin, or a temp file when it must seek."""
+    try:
+        probe = None
+        if not _needs_seekable_input(audio_bytes, filename):
+            try:
+                probe = _parse_probe(_run_ffprobe(audio_bytes))
+            except STSBackendError as exc:
+                if exc.error_code not in _PIPE_RETRY_CODES:
+                    raise
+        if probe is None or not probe.tracks:
+            with _temp_audio_file(audio_bytes, filename) as tmp_path:
+                probe = _parse_probe(_run_ffprobe(tmp_path))
+    except STSBackendError:
+        if required:
+            raise
+        return AudioProbeModel()
+    return _with_upload_metadata(probe, audio_bytes, filename)
+
+
+async def probe_audio_bytes_async(
+    audio_bytes: AudioBuffer, filename: str = "audio.webm", required: bool = True
+) -> AudioProbeModel:
+    """Async ``probe_audio_bytes`` — ffprobe runs without blocking the event loop."""
+    try:
+        probe = None
+        if not _needs_seekable_input(audio_bytes, filename):
+            try:
+                probe = _parse_probe(await _run_ffprobe_async(audio_bytes))
+            except STSBackendError as exc:
+                if exc.error_code not in _PIPE_RETRY_CODES:
+                    raise
+        if probe is None or not probe.tracks:
+            with _temp_audio_file(audio_bytes, filename) as tmp_path:
+                probe = _parse_probe(await _run_ffprobe_async(tmp_path))
+    except STSBackendError:
+        if required:
+            raise
+        return AudioProbeModel()
+    return _with_upload_metadata(probe, audio_bytes, filename)
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    from orjson import dumps as payload_json
+except ImportError:  # optional speedup (``perf`` extra)
+    from json import dumps as _json_dumps
+
+    def payload_json(payload: Any) -> bytes:
+        return _json_dumps(payload).encode("utf-8")
 
 # ── Errors ──────────────────────────────────────────────────────────────────
 
@@ -41,21 +53,30 @@ class STSBackendError(Exception):
             payload["meta"] = self.meta
         return payload
 
+    def to_json(self) -> bytes:
+        return payload_json(self.to_payload())
+
 
 # ── Models ──────────────────────────────────────────────────────────────────
 
 
-class BackendOptionModel(BaseModel):
+# Plain DTOs built on every request are slotted dataclasses; pydantic is kept for
+# the request models that validate caller-supplied dicts.
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BackendOptionModel:
     id: str
     label: str
     description: str
     live: bool = False
 
     def to_dict(self) -> dict[str, Any]:
-        return self.model_dump()
+        return {"id": self.id, "label": self.label, "description": self.description, "live": self.live}
 
 
-class BackendHealthModel(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BackendHealthModel:
     id: str
     label: str
     ready: bool
@@ -63,11 +84,18 @@ class BackendHealthModel(BaseModel):
     remediation: str
 
     def to_dict(self) -> dict[str, Any]:
-        return self.model_dump()
+        return {
+            "id": self.id,
+            "label": self.label,
+            "ready": self.ready,
+            "reason": self.reason,
+            "remediation": self.remediation,
+        }
 
 
-class AudioTrackModel(BaseModel):
-    source: str = Field(description="Metadata source: ffprobe or native_live")
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AudioTrackModel:
+    source: str  # metadata source: ffprobe or native_live
     stream_index: int = 0
     codec_name: str | None = None
     codec_long_name: str | None = None
@@ -78,17 +106,42 @@ class AudioTrackModel(BaseModel):
     duration_seconds: float | None = None
     time_base: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "stream_index": self.stream_index,
+            "codec_name": self.codec_name,
+            "codec_long_name": self.codec_long_name,
+            "sample_rate_hz": self.sample_rate_hz,
+            "channels": self.channels,
+            "channel_layout": self.channel_layout,
+            "bit_rate_bps": self.bit_rate_bps,
+            "duration_seconds": self.duration_seconds,
+            "time_base": self.time_base,
+        }
 
-class AudioFormatModel(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class AudioFormatModel:
     container_name: str | None = None
     duration_seconds: float | None = None
     bit_rate_bps: int | None = None
     size_bytes: int | None = None
     filename: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "container_name": self.container_name,
+            "duration_seconds": self.duration_seconds,
+            "bit_rate_bps": self.bit_rate_bps,
+            "size_bytes": self.size_bytes,
+            "filename": self.filename,
+        }
 
-class AudioProbeModel(BaseModel):
-    tracks: list[AudioTrackModel] = Field(default_factory=list)
+
+@dataclass(slots=True, kw_only=True)
+class AudioProbeModel:
+    tracks: list[AudioTrackModel] = field(default_factory=list)
     audio_format: AudioFormatModel | None = None
     raw: dict[str, Any] | None = None
 
@@ -101,11 +154,12 @@ class TranscriptionRequestModel(BaseModel):
     locale: str | None = None
 
 
-class TranscriptionResultModel(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TranscriptionResultModel:
     text: str
     backend: str
     model: str | None = None
-    audio_tracks: list[AudioTrackModel] = Field(default_factory=list)
+    audio_tracks: list[AudioTrackModel] = field(default_factory=list)
     audio_format: AudioFormatModel | None = None
 
 
@@ -114,19 +168,38 @@ class LiveStartRequestModel(BaseModel):
     locale: str | None = None
 
 
-class LiveStateModel(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class LiveStateModel:
     running: bool
     locale: str | None = None
     partial: str = ""
-    segments: list[str] = Field(default_factory=list)
+    segments: list[str] = field(default_factory=list)
     transcript: str = ""
     last_error: str = ""
     last_seq: int = 0
-    events: list[dict[str, Any]] = Field(default_factory=list)
+    events: list[dict[str, Any]] = field(default_factory=list)
     backend: str
-    audio_tracks: list[AudioTrackModel] = Field(default_factory=list)
+    audio_tracks: list[AudioTrackModel] = field(default_factory=list)
     audio_format: AudioFormatModel | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "locale": self.locale,
+            "partial": self.partial,
+            "segments": list(self.segments),
+            "transcript": self.transcript,
+            "last_error": self.last_error,
+            "last_seq": self.last_seq,
+            "events": list(self.events),
+            "backend": self.backend,
+            "audio_tracks": [t.to_dict() for t in self.audio_tracks],
+            "audio_format": self.audio_format.to_dict() if self.audio_format else None,
+        }
+
+    def to_json(self) -> bytes:
+        return payload_json(self.to_dict())
+
 
 class SynthesisRequestModel(BaseModel):
     text: str
@@ -135,13 +208,18 @@ class SynthesisRequestModel(BaseModel):
     model_name: str | None = None
 
 
-class SynthesisResultModel(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SynthesisResultModel:
     mode: Literal["audio_bytes", "local_playback"]
     backend: str
     audio_bytes: bytes | None = None
+    # Peak-normalized mono float32 samples, set by local backends before WAV encoding.
+    raw_audio: np.ndarray | None = None
+    sample_rate: int | None = None
 
 
-class STSBackendErrorPayloadModel(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class STSBackendErrorPayloadModel:
     error_code: str
     error_message: str
     backend: str = ""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
@@ -11,7 +12,9 @@ from core import observability
 from core.engine import RuntimeObject
 from core.speech.sts_ffmpeg import ensure_ffprobe_available
 from core.speech.sts_models import STSBackendError, TranscriptionRequestModel, TranscriptionResultModel
+from core.speech.stt_backends import stt_config
 from core.speech.stt_registry import STTRegistry, stt_registry
+from core.utils.helpers import compact_reason
 
 
 class STTService(RuntimeObject):
@@ -20,12 +23,15 @@ class STTService(RuntimeObject):
     name: str = "stt_service"
     registry: STTRegistry = Field(default_factory=lambda: stt_registry)
 
+    async def _shutdown_impl(self) -> None:
+        await asyncio.gather(*(transcriber.aclose() for transcriber in self.registry.transcribers.values()))
+
     def list_transcription_backends(self) -> list[dict[str, Any]]:
         return [backend.to_dict() for backend in self.registry.list_transcription_options()]
 
     def default_transcription_backend(self) -> str:
         configured = os.getenv("STS_TRANSCRIBE_BACKEND", "").strip()
-        valid_ids = {opt.id for opt in self.registry.list_transcription_options()}
+        valid_ids = self.registry.valid_ids()
         if configured and configured in valid_ids:
             return configured
         options = self.registry.list_transcription_options()
@@ -33,7 +39,7 @@ class STTService(RuntimeObject):
 
     def normalize_transcription_backend(self, value: str | None) -> str:
         candidate = str(value or self.default_transcription_backend()).strip()
-        valid_ids = {opt.id for opt in self.registry.list_transcription_options()}
+        valid_ids = self.registry.valid_ids()
         if candidate not in valid_ids:
             raise STSBackendError(
                 error_code="unsupported_backend",
@@ -47,7 +53,7 @@ class STTService(RuntimeObject):
     async def _transcriber_health(self, backend_id: str) -> tuple[bool, str, str]:
         transcriber = self.registry.get_transcriber(backend_id)
         ready, reason, remediation = await transcriber.health_check()
-        if transcriber.supports_file and os.getenv("STS_FFPROBE_REQUIRED", "true").lower() in ("true", "1", "yes"):
+        if transcriber.supports_file and stt_config().ffprobe_required:
             try:
                 ensure_ffprobe_available()
             except STSBackendError as exc:
@@ -55,9 +61,14 @@ class STTService(RuntimeObject):
         return bool(ready), str(reason), str(remediation)
 
     async def get_backend_health(self) -> list[dict[str, Any]]:
+        backends = self.registry.list_transcription_options()
+        # Probes are independent network round trips — run them concurrently.
+        results = await asyncio.gather(*(self._transcriber_health(b.id) for b in backends), return_exceptions=True)
         status: list[dict[str, Any]] = []
-        for backend in self.registry.list_transcription_options():
-            ready, reason, remediation = await self._transcriber_health(backend.id)
+        for backend, result in zip(backends, results):
+            ready, reason, remediation = (
+                (False, compact_reason(result), "") if isinstance(result, BaseException) else result
+            )
             status.append(
                 {
                     "id": backend.id,
@@ -76,6 +87,7 @@ class STTService(RuntimeObject):
         filename: str = "audio.webm",
         backend: str | None = None,
         model_name: str | None = None,
+        log_tracks: bool = True,
     ) -> TranscriptionResultModel:
         selected = self.normalize_transcription_backend(backend)
         observability.log_event(
@@ -85,8 +97,9 @@ class STTService(RuntimeObject):
         )
 
         transcriber = self.registry.get_transcriber(selected)
-        result = await transcriber.transcribe(
-            TranscriptionRequestModel(
+        # Arguments are already typed and the backend id normalized — skip request validation.
+        result = await transcriber.transcribe_trusted(
+            TranscriptionRequestModel.model_construct(
                 audio_bytes=audio_bytes,
                 filename=filename,
                 backend=selected,
@@ -94,15 +107,16 @@ class STTService(RuntimeObject):
             )
         )
 
-        observability.log_event(
-            "sts_audio_tracks",
-            agent="sts",
-            meta={
-                "backend": selected,
-                "tracks": [t.model_dump() for t in result.audio_tracks],
-                "audio_format": result.audio_format.model_dump() if result.audio_format else None,
-            },
-        )
+        if log_tracks:
+            observability.log_event(
+                "sts_audio_tracks",
+                agent="sts",
+                meta_factory=lambda: {
+                    "backend": selected,
+                    "tracks": [t.to_dict() for t in result.audio_tracks],
+                    "audio_format": result.audio_format.to_dict() if result.audio_format else None,
+                },
+            )
         return result
 
     async def transcribe(
@@ -118,6 +132,7 @@ class STTService(RuntimeObject):
             filename=filename,
             backend=backend,
             model_name=model_name,
+            log_tracks=False,  # only the text is returned — skip the track metadata event
         )
         return result.text
 
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cache
 from typing import Any
 
 import httpx
 from openai import AsyncOpenAI
-from pydantic import BaseModel, Field
 
 from core import observability
-from core.speech.sts_ffmpeg import probe_audio_bytes
+from core.speech.sts_ffmpeg import probe_audio_bytes_async
 from core.speech.sts_models import (
     AudioProbeModel,
     LiveStateModel,
@@ -22,15 +26,67 @@ from core.speech.sts_models import (
     TranscriptionResultModel,
 )
 from core.utils.helpers import compact_reason as _compact_reason
+from core.utils.helpers import env_bool
+from core.utils.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class STTConfig:
+    """STT environment settings, resolved once per process (see ``refresh_config``)."""
+
+    whisper_url: str
+    whisper_model: str
+    openai_api_key: str = field(repr=False)
+    qwen3_asr_model: str
+    qwen3_asr_device_map: str
+    qwen3_asr_allow_remote: bool
+    ffprobe_required: bool
+
+
+@cache
+def stt_config() -> STTConfig:
+    return STTConfig(
+        whisper_url=os.getenv("WHISPER_API_URL", "http://127.0.0.1:1234/v1"),
+        whisper_model=os.getenv("WHISPER_MODEL", "whisper-large-v3-turbo"),
+        openai_api_key=os.getenv("OPENAI_API_KEY", "") or "lm-studio",
+        qwen3_asr_model=os.getenv("QWEN3_ASR_MODEL", "models/qwen3-asr-0.6b"),
+        qwen3_asr_device_map=os.getenv("QWEN3_ASR_DEVICE_MAP", "auto"),
+        qwen3_asr_allow_remote=env_bool("QWEN3_ASR_ALLOW_REMOTE"),
+        ffprobe_required=env_bool("STS_FFPROBE_REQUIRED", True),
+    )
+
+
+def refresh_config() -> STTConfig:
+    """Drop the cached settings and re-read the environment (tests, hot reconfiguration)."""
+    stt_config.cache_clear()
+    return stt_config()
+
+
+# ffprobe output is a pure function of the bytes — retried uploads reuse the earlier probe.
+_PROBE_CACHE: OrderedDict[tuple[bytes, str], AudioProbeModel] = OrderedDict()
+_PROBE_CACHE_SIZE = 64
+# Larger uploads are hashed off the event loop (blake2b releases the GIL).
+_HASH_INLINE_LIMIT = 1 << 20
+
+
+async def _probe_cache_key(audio_bytes: bytes, filename: str) -> tuple[bytes, str]:
+    if len(audio_bytes) > _HASH_INLINE_LIMIT:
+        digest = await asyncio.to_thread(hashlib.blake2b, audio_bytes, digest_size=16)
+    else:
+        digest = hashlib.blake2b(audio_bytes, digest_size=16)
+    return digest.digest(), filename
+
+
+# Probes should fail fast even though the shared client allows longer requests.
+_HEALTH_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+
 async def _check_openai_endpoint(*, base_url: str, backend: str, remediation: str) -> tuple[bool, str, str]:
     endpoint = base_url.rstrip("/") + "/models"
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(endpoint)
+        response = await get_http_client().get(endpoint, timeout=_HEALTH_TIMEOUT)
         if response.status_code < 500:
             return True, f"Endpoint reachable ({response.status_code}).", remediation
         return False, f"Endpoint responded with {response.status_code}.", remediation
@@ -38,25 +94,30 @@ async def _check_openai_endpoint(*, base_url: str, backend: str, remediation: st
         return False, _compact_reason(f"{backend} unreachable: {exc}"), remediation
 
 
-class AudioTranscriberBaseModel(BaseModel):
-    """Template flow for file and live transcription backends."""
+@dataclass(slots=True, kw_only=True)
+class AudioTranscriberBaseModel:
+    """Template flow for file and live transcription backends.
+
+    Plain slotted dataclass: backends are fixed configuration plus behaviour, nothing to validate.
+    """
 
     backend_id: str
     display_label: str = ""
     supports_file: bool = True
     supports_live: bool = False
-    ffprobe_required: bool = Field(
-        default_factory=lambda: os.getenv("STS_FFPROBE_REQUIRED", "true").lower() in ("true", "1", "yes")
-    )
-
-    model_config = {"arbitrary_types_allowed": True}
+    ffprobe_required: bool = field(default_factory=lambda: stt_config().ffprobe_required)
 
     async def transcribe(self, request: TranscriptionRequestModel | dict[str, Any]) -> TranscriptionResultModel:
+        # Exact type check: already-built requests skip the validator entirely.
         req = (
             request
-            if isinstance(request, TranscriptionRequestModel)
+            if type(request) is TranscriptionRequestModel
             else TranscriptionRequestModel.model_validate(request)
         )
+        return await self.transcribe_trusted(req)
+
+    async def transcribe_trusted(self, req: TranscriptionRequestModel) -> TranscriptionResultModel:
+        """Transcribe a request the caller has already validated (or built from typed arguments)."""
         if not self.supports_file:
             raise STSBackendError(
                 error_code="live_backend_only",
@@ -81,7 +142,8 @@ class AudioTranscriberBaseModel(BaseModel):
             meta={"backend": self.backend_id, "audio_size": len(req.audio_bytes)},
         )
         try:
-            probe = await self.capture_audio_probe(req)
+            # The ffprobe pass and backend warmup are independent — overlap them.
+            probe, _ = await asyncio.gather(self.capture_audio_probe(req), self._prepare(req))
             result = await self._transcribe_impl(req, probe)
             elapsed_ms = round((time.perf_counter() - t0) * 1000)
             observability.log_event(
@@ -108,9 +170,13 @@ class AudioTranscriberBaseModel(BaseModel):
     async def capture_audio_probe(self, request: TranscriptionRequestModel) -> AudioProbeModel:
         if not request.audio_bytes:
             return AudioProbeModel()
+        key = await _probe_cache_key(request.audio_bytes, request.filename)
+        # Probes are mutable and end up inside results — the cache only ever hands out copies.
+        if (cached := _PROBE_CACHE.get(key)) is not None:
+            _PROBE_CACHE.move_to_end(key)
+            return copy.deepcopy(cached)
         try:
-            return await asyncio.to_thread(
-                probe_audio_bytes,
+            probe = await probe_audio_bytes_async(
                 request.audio_bytes,
                 request.filename,
                 bool(self.ffprobe_required),
@@ -127,6 +193,16 @@ class AudioTranscriberBaseModel(BaseModel):
                     status_code=503,
                 ) from exc
             return AudioProbeModel()
+        # Empty probes (ffprobe optional and failed) are not cached so a fixed setup is picked up.
+        if probe.tracks or probe.audio_format is not None:
+            _PROBE_CACHE[key] = copy.deepcopy(probe)
+            if len(_PROBE_CACHE) > _PROBE_CACHE_SIZE:
+                _PROBE_CACHE.popitem(last=False)
+        return probe
+
+    async def _prepare(self, request: TranscriptionRequestModel) -> None:
+        """Warm clients/models needed by ``_transcribe_impl``; runs concurrently with the audio probe."""
+        return None
 
     async def _transcribe_impl(
         self, request: TranscriptionRequestModel, probe: AudioProbeModel
@@ -172,23 +248,43 @@ class AudioTranscriberBaseModel(BaseModel):
     async def health_check(self) -> tuple[bool, str, str]:
         raise NotImplementedError("Transcriber backend must implement health_check().")
 
+    async def aclose(self) -> None:
+        """Release network clients or other resources held by the backend."""
+        return None
+
 
+@dataclass(slots=True, kw_only=True)
 class WhisperAPITranscriber(AudioTranscriberBaseModel):
     backend_id: str = "whisper_api"
     display_label: str = "Whisper API"
     supports_file: bool = True
     supports_live: bool = False
 
+    _client: AsyncOpenAI | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_client(self) -> AsyncOpenAI:
+        # One client per backend keeps the endpoint connection alive between transcriptions.
+        if self._client is None or self._client.is_closed():
+            cfg = stt_config()
+            self._client = AsyncOpenAI(base_url=cfg.whisper_url, api_key=cfg.openai_api_key)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+    async def _prepare(self, request: TranscriptionRequestModel) -> None:
+        self._get_client()
+
     async def _transcribe_impl(
         self, request: TranscriptionRequestModel, probe: AudioProbeModel
     ) -> TranscriptionResultModel:
-        client = AsyncOpenAI(
-            base_url=os.getenv("WHISPER_API_URL", "http://127.0.0.1:1234/v1"),
-            api_key=os.getenv("OPENAI_API_KEY", "") or "lm-studio",
-        )
+        cfg = stt_config()
+        client = self._get_client()
         try:
             resp = await client.audio.transcriptions.create(
-                model=os.getenv("WHISPER_MODEL", "whisper-large-v3-turbo"),
+                model=cfg.whisper_model,
                 file=(request.filename, request.audio_bytes),
             )
             text = str(resp.text or "").strip()
@@ -203,8 +299,8 @@ class WhisperAPITranscriber(AudioTranscriberBaseModel):
             return TranscriptionResultModel(
                 text=text,
                 backend=self.backend_id,
-                model=os.getenv("WHISPER_MODEL", "whisper-large-v3-turbo"),
-                audio_tracks=list(probe.tracks),
+                model=cfg.whisper_model,
+                audio_tracks=probe.tracks,
                 audio_format=probe.audio_format,
             )
         except STSBackendError:
@@ -220,38 +316,61 @@ class WhisperAPITranscriber(AudioTranscriberBaseModel):
 
     async def health_check(self) -> tuple[bool, str, str]:
         return await _check_openai_endpoint(
-            base_url=os.getenv("WHISPER_API_URL", "http://127.0.0.1:1234/v1"),
+            base_url=stt_config().whisper_url,
             backend=self.backend_id,
             remediation="Start a Whisper-compatible API server or switch STT backend.",
         )
 
 
+@dataclass(slots=True, kw_only=True)
 class Qwen3ASRTranscriber(AudioTranscriberBaseModel):
     backend_id: str = "qwen3_asr"
     display_label: str = "Qwen3-ASR (Experimental)"
     supports_file: bool = True
     supports_live: bool = False
 
+    async def _prepare(self, request: TranscriptionRequestModel) -> None:
+        from experimental.qwen3_asr import load_model
+
+        cfg = stt_config()
+        try:
+            # No-op once the model is loaded (startup warms it); otherwise load it while ffprobe runs.
+            await asyncio.to_thread(
+                load_model,
+                model_name=str(request.model_name or cfg.qwen3_asr_model).strip(),
+                device_map=cfg.qwen3_asr_device_map,
+                allow_remote=cfg.qwen3_asr_allow_remote,
+            )
+        except Exception as exc:
+            raise STSBackendError(
+                error_code="stt_backend_failure",
+                error_message=_compact_reason(f"Qwen3-ASR model load failed: {exc}"),
+                backend=self.backend_id,
+                remediation="Verify local Qwen model, device_map, and qwen_asr runtime.",
+                status_code=503,
+            ) from exc
+
     async def _transcribe_impl(
         self, request: TranscriptionRequestModel, probe: AudioProbeModel
     ) -> TranscriptionResultModel:
         from experimental.qwen3_asr import transcribe_audio_bytes
 
-        model_name = str(request.model_name or os.getenv("QWEN3_ASR_MODEL", "models/qwen3-asr-0.6b")).strip()
+        cfg = stt_config()
+        model_name = str(request.model_name or cfg.qwen3_asr_model).strip()
         try:
             text = await asyncio.to_thread(
                 transcribe_audio_bytes,
                 request.audio_bytes,
                 filename=request.filename,
                 model_name=model_name,
-                device_map=os.getenv("QWEN3_ASR_DEVICE_MAP", "auto"),
-                allow_remote=os.getenv("QWEN3_ASR_ALLOW_REMOTE", "false").lower() in ("true", "1", "yes"),
+                device_map=cfg.qwen3_asr_device_map,
+                allow_remote=cfg.qwen3_asr_allow_remote,
             )
             return TranscriptionResultModel(
                 text=text,
                 backend=self.backend_id,
                 model=model_name,
-                audio_tracks=list(probe.tracks),
+                audio_tracks=probe.tracks,
                 audio_format=probe.audio_format,
             )
         except Exception as exc:
@@ -266,11 +385,12 @@ class Qwen3ASRTranscriber(AudioTranscriberBaseModel):
     async def health_check(self) -> tuple[bool, str, str]:
         from experimental.qwen3_asr import health_check
 
+        cfg = stt_config()
         check = await asyncio.to_thread(
             health_check,
-            model_name=os.getenv("QWEN3_ASR_MODEL", "models/qwen3-asr-0.6b"),
-            device_map=os.getenv("QWEN3_ASR_DEVICE_MAP", "auto"),
-            allow_remote=os.getenv("QWEN3_ASR_ALLOW_REMOTE", "false").lower() in ("true", "1", "yes"),
+            model_name=cfg.qwen3_asr_model,
+            device_map=cfg.qwen3_asr_device_map,
+            allow_remote=cfg.qwen3_asr_allow_remote,
         )
         return (
             bool(check.get("ready")),
@@ -280,6 +400,9 @@ class Qwen3ASRTranscriber(AudioTranscriberBaseModel):
 
 
 __all__ = [
+    "STTConfig",
+    "stt_config",
+    "refresh_config",
     "AudioTranscriberBaseModel",
     "WhisperAPITranscriber",
     "Qwen3ASRTranscriber",
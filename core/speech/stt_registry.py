@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import Field
+from typing import Any
+
+from pydantic import Field, PrivateAttr
 
 from core.engine import RuntimeObject
 from core.speech.sts_models import BackendOptionModel
@@ -39,8 +41,23 @@ class STTRegistry(RuntimeObject):
         }
     )
 
+    _valid_ids: tuple[tuple[BackendOptionModel, ...], frozenset[str]] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Build the id set with the registry so no request pays for it.
+        self._valid_ids = (self.transcription_options, frozenset(opt.id for opt in self.transcription_options))
+
+    def valid_ids(self) -> frozenset[str]:
+        """Backend ids from ``transcription_options`` (rebuilt only if the options tuple is replaced)."""
+        cached = self._valid_ids
+        if cached is None or cached[0] is not self.transcription_options:
+            cached = (self.transcription_options, frozenset(opt.id for opt in self.transcription_options))
+            self._valid_ids = cached
+        return cached[1]
+
     def list_transcription_options(self) -> list[BackendOptionModel]:
-        return [opt.model_copy(deep=True) for opt in self.transcription_options]
+        # Options are frozen — hand out the shared instances in a fresh list.
+        return list(self.transcription_options)
 
     def get_transcriber(self, backend_id: str) -> AudioTranscriberBaseModel:
         return self.transcribers[backend_id]
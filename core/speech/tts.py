@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
@@ -10,7 +11,9 @@ from pydantic import Field, PrivateAttr
 from core import observability
 from core.engine import RuntimeObject
 from core.speech.sts_models import STSBackendError, SynthesisRequestModel
+from core.speech.tts_backends import PlayableSynthesizerBase
 from core.speech.tts_registry import TTSRegistry, tts_registry
+from core.utils.helpers import compact_reason
 
 
 class TTSService(RuntimeObject):
@@ -24,6 +27,16 @@ class TTSService(RuntimeObject):
     def _initialize_impl(self) -> Any:
         return self._warmup_models()
 
+    async def _shutdown_impl(self) -> None:
+        # Closing waits for any in-flight playback to release the stream lock — keep it off the loop.
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(synthesizer.close_output_stream)
+                for synthesizer in self.registry.synthesizers.values()
+                if isinstance(synthesizer, PlayableSynthesizerBase)
+            )
+        )
+
     async def _warmup_models(self) -> None:
         warmup_status = await self.registry.warmup_tts_models()
         for backend_id, payload in warmup_status.items():
@@ -42,7 +55,7 @@ class TTSService(RuntimeObject):
 
     def default_tts_backend(self) -> str:
         configured = os.getenv("STS_TTS_BACKEND", "qwen3_tts").strip()
-        valid_ids = {opt.id for opt in self.registry.list_tts_options()}
+        valid_ids = self.registry.valid_ids()
         if configured and configured in valid_ids:
             return configured
         options = self.registry.list_tts_options()
@@ -50,13 +63,13 @@ class TTSService(RuntimeObject):
 
     def normalize_tts_backend(self, value: str | None) -> str:
         candidate = str(value or self.default_tts_backend()).strip()
-        valid_ids = {opt.id for opt in self.registry.list_tts_options()}
+        valid_ids = self.registry.valid_ids()
         if candidate not in valid_ids:
             raise STSBackendError(
                 error_code="unsupported_backend",
                 error_message=f"Unsupported TTS backend: {candidate}",
                 backend=candidate,
-                remediation="Select 'qwen3_tts'.",
+                remediation=f"Select one of {', '.join(sorted(valid_ids))}.",
                 status_code=400,
             )
         return candidate
@@ -67,9 +80,14 @@ class TTSService(RuntimeObject):
         return bool(ready), str(reason), str(remediation)
 
     async def get_backend_health(self) -> list[dict[str, Any]]:
+        backends = self.registry.list_tts_options()
+        # Probes are independent network round trips — run them concurrently.
+        results = await asyncio.gather(*(self._synthesizer_health(b.id) for b in backends), return_exceptions=True)
         status: list[dict[str, Any]] = []
-        for backend in self.registry.list_tts_options():
-            ready, reason, remediation = await self._synthesizer_health(backend.id)
+        for backend, result in zip(backends, results):
+            ready, reason, remediation = (
+                (False, compact_reason(result), "") if isinstance(result, BaseException) else result
+            )
             status.append(
                 {
                     "id": backend.id,
@@ -6,22 +6,44 @@ import asyncio
 import io
 import logging
 import os
+import struct
+import threading
 import time
+from functools import cache
 from pathlib import Path
 from typing import Any, ClassVar
 
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
 from pydantic import BaseModel, Field, PrivateAttr
 
 from core import observability
 from core.speech.sts_models import STSBackendError, SynthesisRequestModel, SynthesisResultModel
 from core.utils.helpers import compact_reason as _compact_reason
 from core.utils.helpers import download_hf_snapshot as _download_hf_snapshot
+from core.utils.helpers import env_bool
+from core.utils.helpers import hf_snapshot_complete as _hf_snapshot_complete
 
 logger = logging.getLogger(__name__)
 
+# RIFF/WAVE header for mono PCM16: riff size, fmt chunk, data chunk size.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+# Audio I/O libraries load native code (PortAudio opens the host audio API on
+# import) — defer them until playback or decoding actually happens.
+@cache
+def _sounddevice() -> Any:
+    import sounddevice
+
+    return sounddevice
+
+
+@cache
+def _soundfile() -> Any:
+    import soundfile
+
+    return soundfile
+
 
 def _resolve_torch_device(preferred: str) -> str:
     value = str(preferred or "auto").strip().lower()
@@ -39,21 +61,88 @@ def _resolve_torch_device(preferred: str) -> str:
     return "cpu"
 
 
-def _as_mono_float32(audio: Any) -> np.ndarray:
+def _int8_quantization_config() -> Any | None:
+    try:
+        import bitsandbytes  # noqa: F401
+        from transformers import BitsAndBytesConfig
+    except ImportError:
+        return None
+    return BitsAndBytesConfig(load_in_8bit=True)
+
+
+def _torch_module(model: Any) -> Any | None:
+    """The ``nn.Module`` behind a model wrapper (``qwen_tts`` keeps it on ``.model``)."""
+    import torch
+
+    module = model if isinstance(model, torch.nn.Module) else getattr(model, "model", None)
+    return module if isinstance(module, torch.nn.Module) else None
+
+
+def _quantize_dynamic_int8(model: Any) -> Any:
+    """Swap the Linear layers of a CPU model for int8 dynamic-quantized ones; unquantized on failure."""
+    try:
+        import torch
+
+        if (module := _torch_module(model)) is not None:
+            torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    except Exception as exc:
+        logger.warning("Dynamic int8 quantization failed, keeping float32 weights: %s", exc)
+    return model
+
+
+def _compile_model(model: Any) -> Any:
+    """Compile the model's forward in place; the first (warmup) synthesis pays the compile cost."""
+    try:
+        if (module := _torch_module(model)) is not None:
+            module.compile(mode="reduce-overhead", dynamic=True)
+    except Exception as exc:
+        logger.warning("torch.compile failed, running the TTS model eagerly: %s", exc)
+    return model
+
+
+def _as_float32_array(audio: Any) -> np.ndarray:
     if audio is None:
         raise RuntimeError("Audio payload is empty.")
-
     if hasattr(audio, "detach") and hasattr(audio, "cpu"):
         audio = audio.detach().cpu().numpy()
-
     arr = np.asarray(audio, dtype=np.float32)
-    if arr.ndim == 0:
-        return np.asarray([float(arr)], dtype=np.float32)
+    return arr.reshape(1) if arr.ndim == 0 else arr
+
+
+def _channel_axis(arr: np.ndarray) -> int:
+    return 0 if arr.shape[0] <= 8 and arr.shape[0] < arr.shape[-1] else -1
+
+
+def _as_mono_float32(audio: Any, out: np.ndarray | None = None) -> np.ndarray:
+    """Downmix to mono float32; with ``out``, the result is written into that buffer."""
+    if out is None and isinstance(audio, np.ndarray) and audio.dtype == np.float32 and audio.ndim == 1:
+        return audio
+
+    arr = _as_float32_array(audio)
     if arr.ndim == 1:
-        return arr
-    if arr.shape[0] <= 8 and arr.shape[0] < arr.shape[-1]:
-        return np.mean(arr, axis=0, dtype=np.float32)
-    return np.mean(arr, axis=-1, dtype=np.float32)
+        if out is None:
+            return arr
+        np.copyto(out, arr)
+        return out
+    axis = _channel_axis(arr)
+    # Sum into the only new buffer, then scale it in place — no mean() temporaries.
+    mono = np.add.reduce(arr, axis=axis, dtype=np.float32, out=out)
+    mono *= np.float32(1.0 / arr.shape[axis])
+    return mono
+
+
+def _concat_mono_float32(chunks: list[Any]) -> np.ndarray:
+    """Downmix and join audio chunks into one preallocated buffer, without per-chunk mono copies."""
+    arrays = [_as_float32_array(chunk) for chunk in chunks]
+    if any(arr.ndim > 2 for arr in arrays):
+        return np.concatenate([_as_mono_float32(arr) for arr in arrays])
+    lengths = [arr.size if arr.ndim == 1 else arr.size // arr.shape[_channel_axis(arr)] for arr in arrays]
+    out = np.empty(sum(lengths), dtype=np.float32)
+    offset = 0
+    for arr, length in zip(arrays, lengths):
+        _as_mono_float32(arr, out=out[offset : offset + length])
+        offset += length
+    return out
 
 
 def _coerce_audio_output(output: Any, *, default_sample_rate: int) -> tuple[np.ndarray, int]:
@@ -74,22 +163,59 @@ def _coerce_audio_output(output: Any, *, default_sample_rate: int) -> tuple[np.n
                 break
 
     if isinstance(audio, (bytes, bytearray)):
-        decoded, sr = sf.read(io.BytesIO(bytes(audio)), dtype="float32")
+        decoded, sr = _soundfile().read(io.BytesIO(bytes(audio)), dtype="float32")
         return _as_mono_float32(decoded), int(sr)
 
     return _as_mono_float32(audio), sample_rate
 
 
-def _audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+def _peak_normalized(audio: Any) -> np.ndarray:
+    """Return ``audio`` as mono float32 scaled into [-1, 1], never modifying the caller's array."""
     signal = _as_mono_float32(audio)
     if signal.size == 0:
         raise RuntimeError("Generated audio is empty.")
-    peak = float(np.max(np.abs(signal))) if signal.size else 0.0
+    # Two allocation-free SIMD reductions; np.abs(signal).max() and
+    # np.linalg.norm(signal, ord=np.inf) both materialize |signal| first.
+    peak = max(float(signal.max()), -float(signal.min()))
     if peak > 1.0:
-        signal = signal / peak
-    buf = io.BytesIO()
-    sf.write(buf, signal, int(sample_rate), format="WAV")
-    return buf.getvalue()
+        if signal is not audio and signal.flags.owndata:
+            signal /= np.float32(peak)
+        else:
+            signal = signal / peak
+    return signal
+
+
+def _encode_wav_pcm16(signal: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono float audio in [-1, 1] as a 16-bit PCM WAV (same output as ``sf.write``)."""
+    # libsndfile's conversion: scale by 2**15, floor, clip to the int16 range.
+    pcm = np.multiply(signal, 32768.0, dtype=np.float32)
+    np.floor(pcm, out=pcm)
+    np.clip(pcm, -32768, 32767, out=pcm)
+    data = pcm.astype("<i2").tobytes()
+    header = _WAV_HEADER.pack(
+        b"RIFF", 36 + len(data), b"WAVE", b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16, b"data", len(data)
+    )
+    return header + data
+
+
+def _reference_tone(sample_rate: int, duration: float) -> np.ndarray:
+    """220 Hz + 440 Hz tone with 0.2 s linear fade in/out, built in two preallocated buffers."""
+    t = np.arange(int(sample_rate * duration), dtype=np.float32)
+    t *= np.float32(1.0 / sample_rate)
+    signal = np.multiply(t, np.float32(2.0 * np.pi * 220.0))
+    np.sin(signal, out=signal)
+    signal *= np.float32(0.08)
+    scratch = np.multiply(t, np.float32(2.0 * np.pi * 440.0))
+    np.sin(scratch, out=scratch)
+    scratch *= np.float32(0.04)
+    signal += scratch
+    # Envelope: min(t, duration - t) / 0.2, clipped to [0, 1].
+    np.subtract(np.float32(duration), t, out=scratch)
+    np.minimum(scratch, t, out=scratch)
+    scratch *= np.float32(5.0)
+    np.clip(scratch, 0.0, 1.0, out=scratch)
+    signal *= scratch
+    return signal
 
 
 class SpeechSynthesizerBaseModel(BaseModel):
@@ -101,7 +227,15 @@ class SpeechSynthesizerBaseModel(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
     async def synthesize(self, request: SynthesisRequestModel | dict[str, Any]) -> SynthesisResultModel:
-        req = request if isinstance(request, SynthesisRequestModel) else SynthesisRequestModel.model_validate(request)
+        # Exact type check: already-built requests skip the validator entirely.
+        req = request if type(request) is SynthesisRequestModel else SynthesisRequestModel.model_validate(request)
+        result = await self._synthesize_validated(req)
+        if result.audio_bytes is None and result.raw_audio is not None:
+            # Callers of the public API get WAV bytes; in-process playback uses raw_audio directly.
+            result.audio_bytes = await asyncio.to_thread(_encode_wav_pcm16, result.raw_audio, result.sample_rate)
+        return result
+
+    async def _synthesize_validated(self, req: SynthesisRequestModel) -> SynthesisResultModel:
         if not req.text.strip():
             raise STSBackendError(
                 error_code="text_required",
@@ -137,7 +271,7 @@ class SpeechSynthesizerBaseModel(BaseModel):
                     "backend": self.backend_id,
                     "duration_ms": elapsed_ms,
                     "mode": result.mode,
-                    "has_audio": result.audio_bytes is not None,
+                    "has_audio": result.audio_bytes is not None or result.raw_audio is not None,
                 },
             )
             logger.info("TTS %s completed in %dms (mode=%s)", self.backend_id, elapsed_ms, result.mode)
@@ -165,6 +299,9 @@ class SpeechSynthesizerBaseModel(BaseModel):
 class PlayableSynthesizerBase(SpeechSynthesizerBaseModel):
     """Base class for synthesizers that support real-time audio playback via sounddevice."""
 
+    _output_stream: Any = PrivateAttr(default=None)
+    _playback_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     async def speak(
         self,
         text: str,
@@ -173,9 +310,9 @@ class PlayableSynthesizerBase(SpeechSynthesizerBaseModel):
     ) -> None:
         try:
             req = SynthesisRequestModel(text=text, backend=self.backend_id, voice=voice)
-            result = await self.synthesize(req)
+            result = await self._synthesize_validated(req)
 
-            if not result.audio_bytes:
+            if result.raw_audio is None and not result.audio_bytes:
                 raise STSBackendError(
                     error_code="no_audio_bytes",
                     error_message="Synthesis returned no audio bytes.",
@@ -184,7 +321,10 @@ class PlayableSynthesizerBase(SpeechSynthesizerBaseModel):
                     status_code=503,
                 )
 
-            await asyncio.to_thread(self._play_audio_bytes, result.audio_bytes, blocking)
+            if result.raw_audio is not None:
+                await asyncio.to_thread(self._play_audio_array, result.raw_audio, result.sample_rate, blocking)
+            else:
+                await asyncio.to_thread(self._play_audio_bytes, result.audio_bytes, blocking)
             logger.info("Playback completed for backend %s", self.backend_id)
         except STSBackendError:
             raise
@@ -197,23 +337,57 @@ class PlayableSynthesizerBase(SpeechSynthesizerBaseModel):
                 status_code=503,
             ) from exc
 
-    @staticmethod
-    def _play_audio_bytes(audio_bytes: bytes, blocking: bool = True) -> None:
+    def _play_audio_bytes(self, audio_bytes: bytes, blocking: bool = True) -> None:
         try:
-            data, sample_rate = sf.read(io.BytesIO(audio_bytes))
-
-            if data.ndim == 1:
-                data = data.reshape(-1, 1)
-
-            if blocking:
-                sd.play(data, samplerate=sample_rate, blocking=True)
-            else:
-                sd.play(data, samplerate=sample_rate, blocking=False)
+            data, sample_rate = _soundfile().read(io.BytesIO(audio_bytes), dtype="float32")
+        except Exception as exc:
+            raise RuntimeError(f"Failed to play audio: {exc}") from exc
+        self._play_audio_array(data, int(sample_rate), blocking)
 
-            logger.debug("Audio playback started: %d samples at %d Hz", len(data), sample_rate)
+    def _play_audio_array(self, data: np.ndarray, sample_rate: int, blocking: bool = True) -> None:
+        if blocking:
+            self._write_to_output_stream(data, int(sample_rate))
+        else:
+            threading.Thread(
+                target=self._write_to_output_stream_logged,
+                args=(data, int(sample_rate)),
+                name=f"{self.backend_id}-playback",
+                daemon=True,
+            ).start()
+        logger.debug("Audio playback started: %d samples at %d Hz", len(data), sample_rate)
+
+    def _write_to_output_stream(self, data: np.ndarray, sample_rate: int) -> None:
+        """Play ``data`` on a long-lived PortAudio stream, reopening it only when the format changes."""
+        # OutputStream.write takes 1-D arrays as mono directly.
+        channels = 1 if data.ndim == 1 else int(data.shape[1])
+        try:
+            with self._playback_lock:
+                stream = self._output_stream
+                if stream is None or stream.closed or (stream.samplerate, stream.channels) != (sample_rate, channels):
+                    if stream is not None:
+                        stream.close()
+                    stream = _sounddevice().OutputStream(
+                        samplerate=sample_rate, channels=channels, dtype="float32", blocksize=2048
+                    )
+                    stream.start()
+                    self._output_stream = stream
+                stream.write(np.ascontiguousarray(data, dtype=np.float32))
         except Exception as exc:
             raise RuntimeError(f"Failed to play audio: {exc}") from exc
 
+    def _write_to_output_stream_logged(self, data: np.ndarray, sample_rate: int) -> None:
+        try:
+            self._write_to_output_stream(data, sample_rate)
+        except Exception as exc:
+            logger.warning("Background playback failed for backend %s: %s", self.backend_id, exc)
+
+    def close_output_stream(self) -> None:
+        """Release the playback stream (it is reopened on the next ``speak``)."""
+        with self._playback_lock:
+            if self._output_stream is not None:
+                self._output_stream.close()
+                self._output_stream = None
+
 
 class LocalModelSynthesizerBase(SpeechSynthesizerBaseModel):
     """Base class for local HF model-backed synthesizers."""
@@ -241,24 +415,30 @@ class LocalModelSynthesizerBase(SpeechSynthesizerBaseModel):
     def _generate_audio_impl(self, request: SynthesisRequestModel) -> tuple[np.ndarray, int]:
         raise NotImplementedError("Synthesizer backend must implement _generate_audio_impl().")
 
+    def _render_audio(self, request: SynthesisRequestModel) -> tuple[np.ndarray, int]:
+        audio, sample_rate = self._generate_audio_impl(request)
+        return _peak_normalized(audio), int(sample_rate)
+
     async def ensure_ready(self) -> Path:
         async with self._warmup_lock:
             local_dir = self._resolve_local_dir()
             if not self._snapshot_ready:
-                snapshot_exists = local_dir.exists() and any(local_dir.iterdir())
-                if not snapshot_exists:
+                if not _hf_snapshot_complete(local_dir):
                     try:
                         await asyncio.to_thread(_download_hf_snapshot, self.repo_id, local_dir)
                     except STSBackendError:
                         raise
                     except Exception as exc:
-                        raise STSBackendError(
-                            error_code="tts_model_download_failed",
-                            error_message=_compact_reason(f"Failed to download TTS model {self.repo_id}: {exc}"),
-                            backend=self.backend_id,
-                            remediation=f"Ensure network/HF access for {self.repo_id} and retry startup.",
-                            status_code=503,
-                        ) from exc
+                        # Snapshots from before the sentinel existed (or copied in by hand) stay usable offline.
+                        if not (local_dir.exists() and any(local_dir.iterdir())):
+                            raise STSBackendError(
+                                error_code="tts_model_download_failed",
+                                error_message=_compact_reason(f"Failed to download TTS model {self.repo_id}: {exc}"),
+                                backend=self.backend_id,
+                                remediation=f"Ensure network/HF access for {self.repo_id} and retry startup.",
+                                status_code=503,
+                            ) from exc
+                        logger.warning("Could not verify %s snapshot, using existing files: %s", self.repo_id, exc)
                 self._snapshot_ready = True
             if self._model is None:
                 try:
@@ -278,9 +458,11 @@ class LocalModelSynthesizerBase(SpeechSynthesizerBaseModel):
     async def _synthesize_impl(self, request: SynthesisRequestModel) -> SynthesisResultModel:
         try:
             await self.ensure_ready()
-            audio, sample_rate = await asyncio.to_thread(self._generate_audio_impl, request)
-            wav = await asyncio.to_thread(_audio_to_wav_bytes, audio, sample_rate)
-            return SynthesisResultModel(mode="audio_bytes", backend=self.backend_id, audio_bytes=wav)
+            audio, sample_rate = await asyncio.to_thread(self._render_audio, request)
+            # WAV encoding is deferred to ``synthesize`` — local playback never needs it.
+            return SynthesisResultModel(
+                mode="audio_bytes", backend=self.backend_id, raw_audio=audio, sample_rate=sample_rate
+            )
         except STSBackendError:
             raise
         except Exception as exc:
@@ -311,6 +493,7 @@ class Qwen3TTSSynthesizer(LocalModelSynthesizerBase, PlayableSynthesizerBase):
 
     default_voice: str = Field(default_factory=lambda: os.getenv("TTS_QWEN_VOICE", "english"))
     _reference_audio_path: Path | None = PrivateAttr(default=None)
+    _language_set: frozenset[str] | None = PrivateAttr(default=None)
     _DEFAULT_REF_DURATION_SECONDS: ClassVar[float] = 2.5
 
     async def ensure_ready(self) -> Path:
@@ -324,18 +507,27 @@ class Qwen3TTSSynthesizer(LocalModelSynthesizerBase, PlayableSynthesizerBase):
 
         _tts_device = os.getenv("TTS_DEVICE", "auto")
         device_map = _tts_device if _tts_device and _tts_device != "auto" else "auto"
+        quantize = env_bool("TTS_QUANTIZE")
+        device = _resolve_torch_device(_tts_device)
         try:
             import torch
 
             # Use float16 for MPS (Apple Silicon) as it has native hardware support
-            dtype = torch.bfloat16 if _resolve_torch_device(_tts_device) in {"cuda", "mps"} else torch.float32
-            return Qwen3TTSModel.from_pretrained(
-                str(local_dir),
-                device_map=device_map,
-                torch_dtype=dtype,
-            )
+            dtype = torch.bfloat16 if device in {"cuda", "mps"} else torch.float32
+            kwargs: dict[str, Any] = {"device_map": device_map, "torch_dtype": dtype}
+            if quantize and device == "cuda" and (config := _int8_quantization_config()) is not None:
+                try:
+                    return Qwen3TTSModel.from_pretrained(str(local_dir), quantization_config=config, **kwargs)
+                except Exception as exc:
+                    logger.warning("8-bit TTS load failed, falling back to %s: %s", dtype, exc)
+            model = Qwen3TTSModel.from_pretrained(str(local_dir), **kwargs)
         except TypeError:
             return Qwen3TTSModel.from_pretrained(str(local_dir), device_map=device_map)
+        if quantize and device == "cpu":
+            model = _quantize_dynamic_int8(model)
+        if env_bool("TTS_COMPILE"):
+            model = _compile_model(model)
+        return model
 
     def _generate_audio_impl(self, request: SynthesisRequestModel) -> tuple[np.ndarray, int]:
         import torch
@@ -347,38 +539,23 @@ class Qwen3TTSSynthesizer(LocalModelSynthesizerBase, PlayableSynthesizerBase):
 
         ref_audio_input = str(ref_audio)
         voice_candidate_path = Path((request.voice or "").strip()).expanduser()
-        if request.voice and voice_candidate_path.exists() and voice_candidate_path.is_file():
+        if request.voice and voice_candidate_path.is_file():
             ref_audio_input = str(voice_candidate_path)
 
         language = "English"
-        supported = {
-            str(lang).strip().lower()
-            for lang in (
-                self._model.get_supported_languages() if hasattr(self._model, "get_supported_languages") else []
-            )
-            if str(lang).strip()
-        }
         voice_candidate = (request.voice or self.default_voice or "").strip().lower()
-        if voice_candidate in supported:
+        if voice_candidate in self._supported_languages():
             language = voice_candidate.title()
 
         wavs: list[np.ndarray]
         sample_rate: int
         with torch.inference_mode():
-            try:
-                wavs, sample_rate = self._model.generate_voice_clone(
-                    text=request.text,
-                    language=language,
-                    ref_audio=ref_audio_input,
-                    x_vector_only_mode=True,
-                )
-            except TypeError:
-                wavs, sample_rate = self._model.generate_voice_clone(
-                    text=request.text,
-                    language=language,
-                    ref_audio=ref_audio_input,
-                    x_vector_only_mode=True,
-                )
+            wavs, sample_rate = self._model.generate_voice_clone(
+                text=request.text,
+                language=language,
+                ref_audio=ref_audio_input,
+                x_vector_only_mode=True,
+            )
 
         if not wavs:
             raise RuntimeError("Qwen3TTSModel returned no audio frames.")
@@ -386,25 +563,30 @@ class Qwen3TTSSynthesizer(LocalModelSynthesizerBase, PlayableSynthesizerBase):
         if len(wavs) == 1:
             audio = _as_mono_float32(wavs[0])
         else:
-            audio = np.concatenate([_as_mono_float32(w) for w in wavs])
+            audio = _concat_mono_float32(wavs)
         return audio, int(sample_rate)
 
+    def _supported_languages(self) -> frozenset[str]:
+        # The language list is fixed per loaded model — build the lookup set once.
+        if self._language_set is None:
+            langs = self._model.get_supported_languages() if hasattr(self._model, "get_supported_languages") else []
+            self._language_set = frozenset(str(lang).strip().lower() for lang in langs if str(lang).strip())
+        return self._language_set
+
     def _ensure_reference_audio(self, local_dir: Path) -> Path:
         reference_dir = local_dir / "references"
         reference_path = reference_dir / "default_clone.wav"
-        if reference_path.exists() and reference_path.stat().st_size > 0:
-            return reference_path
+        try:
+            if reference_path.stat().st_size > 0:
+                return reference_path
+        except FileNotFoundError:
+            pass
 
         reference_dir.mkdir(parents=True, exist_ok=True)
         try:
             sample_rate = int(self.sample_rate_hz)
             duration = float(self._DEFAULT_REF_DURATION_SECONDS)
-            t = np.linspace(0.0, duration, int(sample_rate * duration), endpoint=False, dtype=np.float32)
-            carrier = (0.08 * np.sin(2.0 * np.pi * 220.0 * t)) + (0.04 * np.sin(2.0 * np.pi * 440.0 * t))
-            envelope = np.minimum(1.0, np.minimum(t / 0.2, (duration - t) / 0.2))
-            envelope = np.clip(envelope, 0.0, 1.0).astype(np.float32)
-            signal = (carrier * envelope).astype(np.float32)
-            sf.write(reference_path, signal, sample_rate, format="WAV")
+            reference_path.write_bytes(_encode_wav_pcm16(_reference_tone(sample_rate, duration), sample_rate))
         except Exception as exc:
             raise STSBackendError(
                 error_code="tts_reference_audio_prepare_failed",
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from core.engine import RuntimeObject
 from core.speech.sts_models import BackendOptionModel, STSBackendError, SynthesisRequestModel
@@ -31,60 +32,83 @@ class TTSRegistry(RuntimeObject):
         }
     )
 
+    _valid_ids: tuple[tuple[BackendOptionModel, ...], frozenset[str]] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Build the id set with the registry so no request pays for it.
+        self._valid_ids = (self.tts_options, frozenset(opt.id for opt in self.tts_options))
+
+    def valid_ids(self) -> frozenset[str]:
+        """Backend ids from ``tts_options`` (rebuilt only if the options tuple is replaced)."""
+        cached = self._valid_ids
+        if cached is None or cached[0] is not self.tts_options:
+            cached = (self.tts_options, frozenset(opt.id for opt in self.tts_options))
+            self._valid_ids = cached
+        return cached[1]
+
     def list_tts_options(self) -> list[BackendOptionModel]:
-        return [opt.model_copy(deep=True) for opt in self.tts_options]
+        # Options are frozen — hand out the shared instances in a fresh list.
+        return list(self.tts_options)
 
     def get_synthesizer(self, backend_id: str) -> SpeechSynthesizerBaseModel:
         return self.synthesizers[backend_id]
 
     async def warmup_tts_models(self) -> dict[str, dict[str, Any]]:
+        # Backends download and load independently — warm them concurrently, then
+        # surface the first failure in option order.
+        options = self.list_tts_options()
+        results = await asyncio.gather(*(self._warmup_one(backend) for backend in options), return_exceptions=True)
         status: dict[str, dict[str, Any]] = {}
-        for backend in self.list_tts_options():
-            synthesizer = self.get_synthesizer(backend.id)
-            if isinstance(synthesizer, LocalModelSynthesizerBase):
-                local_dir = await synthesizer.ensure_ready()
-                try:
-                    probe = await synthesizer.synthesize(
-                        SynthesisRequestModel(
-                            text="Warmup health check.",
-                            backend=backend.id,
-                        )
-                    )
-                except STSBackendError as exc:
-                    if exc.error_code in {
-                        "tts_model_download_failed",
-                        "tts_model_load_failed",
-                        "tts_reference_audio_prepare_failed",
-                        "tts_reference_audio_invalid",
-                    }:
-                        raise
-                    raise STSBackendError(
-                        error_code="tts_warmup_synthesis_failed",
-                        error_message=f"{backend.id} warmup synthesis failed: {exc.error_message}",
-                        backend=backend.id,
-                        remediation=exc.remediation or "Verify TTS runtime dependencies and model compatibility.",
-                        status_code=503,
-                        meta={"cause": exc.error_code},
-                    ) from exc
-                status[backend.id] = {
-                    "ready": True,
-                    "path": str(local_dir),
-                    "repo": synthesizer.repo_id,
-                    "probe_mode": probe.mode,
-                    "probe_audio_bytes": len(probe.audio_bytes or b""),
-                }
-            else:
-                ready, reason, remediation = await synthesizer.health_check()
-                if not ready:
-                    raise STSBackendError(
-                        error_code="tts_backend_not_ready",
-                        error_message=reason,
+        for backend, result in zip(options, results):
+            if isinstance(result, BaseException):
+                raise result
+            status[backend.id] = result
+        return status
+
+    async def _warmup_one(self, backend: BackendOptionModel) -> dict[str, Any]:
+        synthesizer = self.get_synthesizer(backend.id)
+        if isinstance(synthesizer, LocalModelSynthesizerBase):
+            local_dir = await synthesizer.ensure_ready()
+            try:
+                probe = await synthesizer.synthesize(
+                    SynthesisRequestModel(
+                        text="Warmup health check.",
                         backend=backend.id,
-                        remediation=remediation,
-                        status_code=503,
                     )
-                status[backend.id] = {"ready": True, "reason": reason}
-        return status
+                )
+            except STSBackendError as exc:
+                if exc.error_code in {
+                    "tts_model_download_failed",
+                    "tts_model_load_failed",
+                    "tts_reference_audio_prepare_failed",
+                    "tts_reference_audio_invalid",
+                }:
+                    raise
+                raise STSBackendError(
+                    error_code="tts_warmup_synthesis_failed",
+                    error_message=f"{backend.id} warmup synthesis failed: {exc.error_message}",
+                    backend=backend.id,
+                    remediation=exc.remediation or "Verify TTS runtime dependencies and model compatibility.",
+                    status_code=503,
+                    meta={"cause": exc.error_code},
+                ) from exc
+            return {
+                "ready": True,
+                "path": str(local_dir),
+                "repo": synthesizer.repo_id,
+                "probe_mode": probe.mode,
+                "probe_audio_bytes": len(probe.audio_bytes or b""),
+            }
+        ready, reason, remediation = await synthesizer.health_check()
+        if not ready:
+            raise STSBackendError(
+                error_code="tts_backend_not_ready",
+                error_message=reason,
+                backend=backend.id,
+                remediation=remediation,
+                status_code=503,
+            )
+        return {"ready": True, "reason": reason}
 
 
 tts_registry = TTSRegistry()
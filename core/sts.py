@@ -59,7 +59,7 @@ class STSService(RuntimeObject):
         exists = path.exists() and any(path.iterdir()) if path.exists() else False
 
         if not exists and active_backend == "qwen3_asr":
-            from core.utils import _HF_ASR_REPO, download_hf_snapshot
+            from core.utils.helpers import _HF_ASR_REPO, download_hf_snapshot
 
             repo_id = os.getenv("QWEN3_ASR_REPO", _HF_ASR_REPO)
             logger.info("Downloading ASR model %s → %s", repo_id, path)
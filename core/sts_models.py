@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ── Errors ──────────────────────────────────────────────────────────────────
 
@@ -46,6 +46,8 @@ class STSBackendError(Exception):
 
 
 class BackendOptionModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     description: str
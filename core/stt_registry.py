@@ -40,7 +40,8 @@ class STTRegistry(RuntimeObject):
     )
 
     def list_transcription_options(self) -> list[BackendOptionModel]:
-        return [opt.model_copy(deep=True) for opt in self.transcription_options]
+        # Options are frozen — hand out the shared instances in a fresh list.
+        return list(self.transcription_options)
 
     def get_transcriber(self, backend_id: str) -> AudioTranscriberBaseModel:
         return self.transcribers[backend_id]
@@ -1,13 +1,19 @@
 """
 MCP tool initialization and wrapping.
 
-Single public API:
-    ``initialize_mcp_tools(server_config, tool_names)`` → ``(callables, client)``
+Public API:
+    ``mcp_tools(server_config, tool_names)`` — ``async with`` scope yielding ``(callables, client)``;
+        the client is closed on exit.
+    ``initialize_mcp_tools(server_config, tool_names)`` → ``(callables, client)`` for long-lived
+        owners, who release the connection with ``close_mcp_client(client)`` (agents take ownership
+        via ``BaseAgent.attach_mcp_client`` and close it in ``aclose()``).
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Callable
 
 from fastmcp import Client
@@ -24,21 +30,46 @@ async def initialize_mcp_tools(
     Each returned callable has signature ``func(inputs: dict) -> str``.
     """
     command = server_config.get("command")
-    args = server_config.get("args", [])
     if not command:
         raise ValueError("server_config must contain 'command' key")
 
-    config = {"mcpServers": {"server": {"command": command, "args": args}}}
-    client = Client(config)
+    client = Client({"mcpServers": {"server": {"command": command, "args": server_config.get("args", [])}}})
     await client.__aenter__()
+    try:
+        return await _wrap_tools(client, tool_names), client
+    except BaseException:
+        await close_mcp_client(client)
+        raise
+
+
+async def close_mcp_client(client: Client | None) -> None:
+    """Close a client returned by ``initialize_mcp_tools`` (no-op for ``None``)."""
+    if client is not None:
+        await client.__aexit__(None, None, None)
+
+
+@asynccontextmanager
+async def mcp_tools(
+    server_config: dict[str, Any],
+    tool_names: list[str],
+) -> AsyncIterator[tuple[list[Callable], Client]]:
+    """Scoped ``initialize_mcp_tools`` — the MCP connection is closed when the block exits."""
+    wrapped, client = await initialize_mcp_tools(server_config, tool_names)
+    try:
+        yield wrapped, client
+    finally:
+        await close_mcp_client(client)
+
+
+async def _wrap_tools(client: Client, tool_names: list[str]) -> list[Callable]:
     all_tools = await client.list_tools()
     logger.info("MCP toolkit initialized with %d tools available", len(all_tools))
 
-    available = {getattr(t, "name", None) for t in all_tools if hasattr(t, "name")}
-    missing = set(tool_names) - available
+    by_name = {name: t for t in all_tools if (name := getattr(t, "name", None)) is not None}
+    missing = set(tool_names).difference(by_name)
     if missing:
-        logger.warning("Requested tools not found: %s. Available: %s", missing, available)
-    selected = [t for t in all_tools if getattr(t, "name", None) in tool_names]
+        logger.warning("Requested tools not found: %s. Available: %s", missing, set(by_name))
+    selected = [by_name[name] for name in dict.fromkeys(tool_names) if name in by_name]
 
     wrapped: list[Callable] = []
     for tool in selected:
@@ -47,9 +78,10 @@ async def initialize_mcp_tools(
         async def _fn(inputs: dict, name: str = tool_name, mcp_client: Client = client) -> str:
             try:
                 result = await mcp_client.call_tool(name, inputs)
-                if hasattr(result, "content"):
-                    return "\n".join(c.text for c in result.content if hasattr(c, "text"))
-                return str(result)
+                content = getattr(result, "content", None)
+                if content is None:
+                    return str(result)
+                return "\n".join([text for c in content if (text := getattr(c, "text", None)) is not None])
             except Exception as e:
                 return f"Error calling {name}: {e}"
 
@@ -57,4 +89,4 @@ async def initialize_mcp_tools(
         _fn.__doc__ = getattr(tool, "description", "MCP tool")
         wrapped.append(_fn)
 
-    return wrapped, client
+    return wrapped
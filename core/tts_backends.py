@@ -205,10 +205,7 @@ class PlayableSynthesizerBase(SpeechSynthesizerBaseModel):
             if data.ndim == 1:
                 data = data.reshape(-1, 1)
 
-            if blocking:
-                sd.play(data, samplerate=sample_rate, blocking=True)
-            else:
-                sd.play(data, samplerate=sample_rate, blocking=False)
+            sd.play(data, samplerate=sample_rate, blocking=bool(blocking))
 
             logger.debug("Audio playback started: %d samples at %d Hz", len(data), sample_rate)
         except Exception as exc:
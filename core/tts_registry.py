@@ -32,7 +32,8 @@ class TTSRegistry(RuntimeObject):
     )
 
     def list_tts_options(self) -> list[BackendOptionModel]:
-        return [opt.model_copy(deep=True) for opt in self.tts_options]
+        # Options are frozen — hand out the shared instances in a fresh list.
+        return list(self.tts_options)
 
     def get_synthesizer(self, backend_id: str) -> SpeechSynthesizerBaseModel:
         return self.synthesizers[backend_id]
@@ -9,7 +9,8 @@ from .logging import (
     log_error,
     log_exception,
 )
-from .helpers import download_hf_snapshot, compact_reason
+from .helpers import download_hf_snapshot, hf_snapshot_complete, compact_reason, env_bool
+from .http import get_http_client, close_http_client
 
 __all__ = [
     "configure_logging",
@@ -20,5 +21,9 @@ __all__ = [
     "log_error",
     "log_exception",
     "download_hf_snapshot",
+    "hf_snapshot_complete",
     "compact_reason",
+    "env_bool",
+    "get_http_client",
+    "close_http_client",
 ]
@@ -3,30 +3,59 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 _HF_ASR_REPO = "Qwen/Qwen3-ASR-0.6B"
 
 
+_SNAPSHOT_SENTINEL = ".snapshot_complete"
+
+_WS_RE = re.compile(r"\s+")
+
+
+_TRUTHY = frozenset(("true", "1", "yes"))
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    """Parse a ``true``/``1``/``yes`` environment flag (case-insensitive); unset → *default*."""
+    value = os.getenv(name)
+    return default if value is None else value.strip().lower() in _TRUTHY
+
+
 def download_hf_snapshot(repo_id: str, local_dir: Path) -> None:
     """Download a HuggingFace model snapshot into *local_dir* if not already present.
 
     Uses ``huggingface_hub.snapshot_download`` so the call is idempotent —
-    already-cached files are not re-fetched.
+    already-cached files are not re-fetched. A sentinel file is written once the
+    snapshot is complete (see ``hf_snapshot_complete``).
     """
     os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "0")
     from huggingface_hub import snapshot_download
 
     local_dir.mkdir(parents=True, exist_ok=True)
     snapshot_download(repo_id=repo_id, local_dir=str(local_dir))
+    (local_dir / _SNAPSHOT_SENTINEL).write_text(f"{repo_id}\n", encoding="utf-8")
+
+
+def hf_snapshot_complete(local_dir: Path) -> bool:
+    """O(1) check that ``download_hf_snapshot`` finished for *local_dir* (interrupted downloads don't count)."""
+    return (local_dir / _SNAPSHOT_SENTINEL).is_file()
 
 
 def compact_reason(value: Any, *, limit: int = 320) -> str:
     """Collapse whitespace and truncate an error/status string."""
-    text = str(value or "").strip()
+    # Stringify first so the cache holds plain text, never exceptions and their tracebacks.
+    return _compact_text(str(value or ""), limit)
+
+
+@lru_cache(maxsize=256)
+def _compact_text(text: str, limit: int) -> str:
+    text = text.strip()
     if not text:
         return "Unknown error."
-    collapsed = " ".join(text.split())
-    max_len = max(80, int(limit))
+    collapsed = _WS_RE.sub(" ", text)
+    max_len = limit if limit >= 80 else 80
     return collapsed if len(collapsed) <= max_len else collapsed[: max_len - 3].rstrip() + "..."
@@ -0,0 +1,26 @@
+"""Process-wide pooled ``httpx.AsyncClient`` shared by core modules."""
+
+from __future__ import annotations
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it on first use (or after ``close_http_client``)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+            timeout=httpx.Timeout(30.0, connect=3.0),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; call once on application shutdown."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
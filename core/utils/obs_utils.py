@@ -15,28 +15,458 @@ Or from CLI::
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
-from collections import Counter, defaultdict
+import sys
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup (``perf`` extra)
+    from json import loads as _json_loads
+
+_READ_CHUNK = 1 << 20
+_TAIL_BLOCK = 64 * 1024
+
+
+def _log_path(path: Path | None) -> Path:
+    return path or Path(os.getenv("OBSERVABILITY_LOG_PATH", "data/observability.jsonl"))
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[dict]:
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            yield _json_loads(line)
+        except ValueError:  # orjson and json decode errors both subclass ValueError
+            continue
+
+
+def _iter_events(p: Path) -> Iterator[dict]:
+    """Stream events from *p* in large binary chunks, one parse per line."""
+    with p.open("rb") as f:
+        pending = b""
+        while chunk := f.read(_READ_CHUNK):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from _parse_lines(lines)
+        if pending:
+            yield from _parse_lines((pending,))
+
 
 def _load_events(path: Path | None = None) -> list[dict]:
     """Load all events from the JSONL log."""
-    p = path or Path(os.getenv("OBSERVABILITY_LOG_PATH", "data/observability.jsonl"))
-    if not p.exists():
+    p = _log_path(path)
+    try:
+        return list(_iter_events(p))
+    except FileNotFoundError:
         return []
-    events: list[dict] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
+
+
+def _tail_events(p: Path, n: int) -> list[dict]:
+    """Parse only the last *n* events by reading fixed-size blocks backwards from EOF."""
+    newest_first: list[dict] = []
+    with p.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos and len(newest_first) < n:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            # The first segment may continue in the previous block — hold it back until then.
+            partial = lines.pop(0) if pos else b""
+            for event in _parse_lines(reversed(lines)):
+                newest_first.append(event)
+                if len(newest_first) == n:
+                    break
+        if partial and len(newest_first) < n:
+            newest_first.extend(_parse_lines((partial,)))
+    return newest_first[:n][::-1]
+
+
+# ── incremental index ────────────────────────────────────────────────────────
+
+# Sidecar next to the log (``observability.jsonl`` → ``observability.idx``): JSON lines, each holding the
+# aggregates folded from one byte range of the log. A call that finds new lines appends one record for
+# just those lines; loading replays the records, which must chain from offset 0 without gaps.
+_INDEX_VERSION = 3
+_HEAD_BYTES = 4096
+# Past this many records the sidecar is rewritten as a single record on the next load.
+_INDEX_COMPACT_RECORDS = 256
+
+_DURATION_TYPES = frozenset(("tool_end", "model_end"))
+_ERROR_TYPES = frozenset(("error", "tool_error"))
+_TRACE_END_TYPES = frozenset(("trace_end", "agent_end"))
+
+
+def _intern(value: Any) -> Any:
+    """Share one string object per distinct type/agent name across every trace.
+
+    The parser allocates a fresh string per event; interning drops the duplicates held by the
+    per-trace state.
+    """
+    return sys.intern(value) if value.__class__ is str else value
+
+
+# In-process copy of the latest aggregate per log path.
+_AGGREGATES: dict[Path, _Aggregate] = {}
+
+
+class _TraceState:
+    __slots__ = ("count", "first", "started", "agents", "types", "duration_at", "duration_ms", "spans")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.first: tuple[Any, int] | None = None
+        self.started: str = ""
+        self.agents: set[str] = set()
+        # type -> [count, (seq, index) of its first occurrence]
+        self.types: dict[str, list[Any]] = {}
+        self.duration_at: tuple[Any, int] | None = None
+        self.duration_ms: Any = None
+        # (byte offset, length) of each of the trace's lines, in file order — show_trace reads only these.
+        self.spans: list[tuple[int, int]] = []
+
+    def copy(self) -> _TraceState:
+        st = _TraceState()
+        st.count, st.first, st.started = self.count, self.first, self.started
+        st.agents = set(self.agents)
+        st.types = {etype: list(seen) for etype, seen in self.types.items()}
+        st.duration_at, st.duration_ms = self.duration_at, self.duration_ms
+        st.spans = list(self.spans)
+        return st
+
+
+class _Aggregate:
+    """Everything ``list_traces``/``stats`` report, folded one event at a time."""
+
+    __slots__ = (
+        "offset",
+        "head",
+        "events",
+        "traces",
+        "type_counts",
+        "agent_counts",
+        "tool_hist",
+        "tool_sum",
+        "model_hist",
+        "model_sum",
+        "errors",
+    )
+
+    def __init__(self) -> None:
+        self.offset = 0  # bytes of the log folded so far (always at a line boundary)
+        self.head = b""  # first bytes of the log — detects rotation/rewrites
+        self.events = 0
+        self.traces: dict[str, _TraceState] = {}
+        self.type_counts: dict[str, int] = {}
+        self.agent_counts: dict[str, int] = {}
+        # Duration histograms (value -> occurrences) keep p95 exact in O(distinct values) memory.
+        self.tool_hist: dict[Any, int] = {}
+        self.tool_sum: int | float = 0
+        self.model_hist: dict[Any, int] = {}
+        self.model_sum: int | float = 0
+        self.errors = 0
+
+    def continues(self, f: Any, size: int) -> bool:
+        """True when the log still starts with the bytes this aggregate was built from."""
+        if size < self.offset:
+            return False
+        f.seek(0)
+        return f.read(len(self.head)) == self.head
+
+    def extend(self, f: Any) -> None:
+        """Fold every complete line after ``offset``; a trailing partial line waits for its newline."""
+        f.seek(self.offset)
+        pending = b""
+        while chunk := f.read(_READ_CHUNK):
+            data = pending + chunk
+            cut = data.rfind(b"\n")
+            if cut < 0:
+                pending = data
+                continue
+            start = self.offset
+            for line in data[:cut].split(b"\n"):
+                if line and not line.isspace():
+                    try:
+                        e = _json_loads(line)
+                    except ValueError:
+                        pass
+                    else:
+                        self._fold(e, (start, len(line)))
+                start += len(line) + 1
+            self.offset += cut + 1
+            pending = data[cut + 1 :]
+        if len(self.head) < _HEAD_BYTES and self.offset > len(self.head):
+            f.seek(0)
+            self.head = f.read(min(self.offset, _HEAD_BYTES))
+
+    def following(self) -> _Aggregate:
+        """An empty aggregate that continues where this one stops — folds only what comes next."""
+        delta = _Aggregate()
+        delta.offset = self.offset
+        delta.head = self.head
+        delta.events = self.events
+        return delta
+
+    def with_unterminated(self, data: bytes) -> _Aggregate:
+        """A throwaway copy that also folds *data*, the bytes after ``offset`` (no trailing newline).
+
+        The writer may still be finishing that line, so it is reported but never indexed or cached.
+        """
+        parsed = []
+        start = self.offset
+        for line in data.split(b"\n"):
+            if line and not line.isspace():
                 try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return events
+                    parsed.append((_json_loads(line), (start, len(line))))
+                except ValueError:
+                    pass
+            start += len(line) + 1
+        if not parsed:
+            return self
+        view = _Aggregate()
+        view.offset, view.head, view.events = self.offset, self.head, self.events
+        view.traces = dict(self.traces)
+        view.type_counts = dict(self.type_counts)
+        view.agent_counts = dict(self.agent_counts)
+        view.tool_hist, view.tool_sum = dict(self.tool_hist), self.tool_sum
+        view.model_hist, view.model_sum = dict(self.model_hist), self.model_sum
+        view.errors = self.errors
+        for e, span in parsed:
+            # Copy-on-write: only the traces these lines touch are duplicated.
+            if (tid := e.get("trace_id")) and (st := self.traces.get(tid)) is not None and view.traces[tid] is st:
+                view.traces[tid] = st.copy()
+            view._fold(e, span)
+        return view
+
+    def merge(self, delta: _Aggregate) -> None:
+        """Absorb *delta* (built by ``following()``) — the same result as folding its lines here."""
+        self.offset = delta.offset
+        self.head = delta.head
+        self.events = delta.events
+        for mine, theirs in (
+            (self.type_counts, delta.type_counts),
+            (self.agent_counts, delta.agent_counts),
+            (self.tool_hist, delta.tool_hist),
+            (self.model_hist, delta.model_hist),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.tool_sum += delta.tool_sum
+        self.model_sum += delta.model_sum
+        self.errors += delta.errors
+        for tid, new in delta.traces.items():
+            st = self.traces.get(tid)
+            if st is None:
+                self.traces[tid] = new
+                continue
+            st.count += new.count
+            if st.first is None or (new.first is not None and new.first < st.first):
+                st.first, st.started = new.first, new.started
+            st.agents |= new.agents
+            for etype, (count, order) in new.types.items():
+                seen = st.types.get(etype)
+                if seen is None:
+                    st.types[etype] = [count, order]
+                else:
+                    seen[0] += count
+                    if order < seen[1]:
+                        seen[1] = order
+            if new.duration_at is not None and (st.duration_at is None or new.duration_at < st.duration_at):
+                st.duration_at, st.duration_ms = new.duration_at, new.duration_ms
+            st.spans.extend(new.spans)
+
+    def _fold(self, e: dict, span: tuple[int, int]) -> None:
+        idx = self.events
+        self.events += 1
+        etype = _intern(e.get("type", "?"))
+        self.type_counts[etype] = self.type_counts.get(etype, 0) + 1
+        agent = _intern(e.get("agent", "?"))
+        self.agent_counts[agent] = self.agent_counts.get(agent, 0) + 1
+
+        # Only end events carry a duration — every other type skips the meta lookup entirely.
+        if etype in _DURATION_TYPES:
+            dur = (e.get("meta") or {}).get("duration_ms")
+            if dur is not None:
+                if etype == "tool_end":
+                    self.tool_hist[dur] = self.tool_hist.get(dur, 0) + 1
+                    self.tool_sum += dur
+                else:
+                    self.model_hist[dur] = self.model_hist.get(dur, 0) + 1
+                    self.model_sum += dur
+        elif etype in _ERROR_TYPES:
+            self.errors += 1
+
+        tid = e.get("trace_id")
+        if not tid:
+            return
+        if (st := self.traces.get(tid)) is None:
+            st = self.traces[tid] = _TraceState()
+        # "First" means lowest seq, ties broken by file order — a stable sort by seq.
+        order = (e.get("seq", 0), idx)
+        st.count += 1
+        st.spans.append(span)
+        if st.first is None or order < st.first:
+            st.first = order
+            st.started = e.get("ts", "")
+        if trace_agent := e.get("agent"):
+            st.agents.add(_intern(trace_agent))
+        seen = st.types.get(etype)
+        if seen is None:
+            st.types[etype] = [1, order]
+        else:
+            seen[0] += 1
+            if order < seen[1]:
+                seen[1] = order
+        if etype in _TRACE_END_TYPES:
+            meta = e.get("meta") or {}
+            if "duration_ms" in meta and (st.duration_at is None or order < st.duration_at):
+                st.duration_at = order
+                st.duration_ms = meta["duration_ms"]
+
+
+def _index_path(p: Path) -> Path:
+    return p.with_suffix(".idx")
+
+
+def _order(value: Any) -> tuple[Any, int] | None:
+    return None if value is None else (value[0], value[1])
+
+
+# Keys are written as [key, value] pairs — trace ids, types and durations need not be strings.
+def _encode(delta: _Aggregate, start: int) -> bytes:
+    record = {
+        "version": _INDEX_VERSION,
+        "start": start,
+        "end": delta.offset,
+        "head": delta.head.hex(),
+        "events": delta.events,
+        "type_counts": list(delta.type_counts.items()),
+        "agent_counts": list(delta.agent_counts.items()),
+        "tool_hist": list(delta.tool_hist.items()),
+        "tool_sum": delta.tool_sum,
+        "model_hist": list(delta.model_hist.items()),
+        "model_sum": delta.model_sum,
+        "errors": delta.errors,
+        "traces": [
+            [
+                tid,
+                st.count,
+                st.first,
+                st.started,
+                sorted(st.agents),
+                [[etype, count, order] for etype, (count, order) in st.types.items()],
+                st.duration_at,
+                st.duration_ms,
+                st.spans,
+            ]
+            for tid, st in delta.traces.items()
+        ],
+    }
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+def _decode(record: dict[str, Any], base: _Aggregate) -> _Aggregate:
+    """Rebuild the delta that *record* describes on top of *base* — raises on any malformed field."""
+    if record["version"] != _INDEX_VERSION or record["start"] != base.offset:
+        raise ValueError("index record does not continue the aggregate")
+    delta = base.following()
+    delta.offset = int(record["end"])
+    delta.head = bytes.fromhex(record["head"])
+    delta.events = int(record["events"])
+    delta.type_counts = {_intern(k): int(c) for k, c in record["type_counts"]}
+    delta.agent_counts = {_intern(k): int(c) for k, c in record["agent_counts"]}
+    delta.tool_hist = {v: int(c) for v, c in record["tool_hist"]}
+    delta.tool_sum = record["tool_sum"]
+    delta.model_hist = {v: int(c) for v, c in record["model_hist"]}
+    delta.model_sum = record["model_sum"]
+    delta.errors = int(record["errors"])
+    for tid, count, first, started, agents, types, duration_at, duration_ms, spans in record["traces"]:
+        st = delta.traces[tid] = _TraceState()
+        st.count = int(count)
+        st.first = _order(first)
+        st.started = started
+        st.agents = {_intern(a) for a in agents}
+        st.types = {_intern(etype): [int(c), _order(order)] for etype, c, order in types}
+        st.duration_at = _order(duration_at)
+        st.duration_ms = duration_ms
+        st.spans = [(int(offset), int(length)) for offset, length in spans]
+    if delta.offset < base.offset or delta.events < base.events:
+        raise ValueError("index record moves backwards")
+    return delta
+
+
+def _read_index(p: Path) -> _Aggregate | None:
+    """Replay the sidecar; None when it is missing, corrupt, or its records do not chain from 0."""
+    agg = _Aggregate()
+    records = 0
+    try:
+        with _index_path(p).open("rb") as f:
+            for line in f:
+                agg.merge(_decode(json.loads(line), agg))
+                records += 1
+    except Exception:  # missing, unreadable, truncated, or written by an incompatible version
+        return None
+    if not records:
+        return None
+    if records > _INDEX_COMPACT_RECORDS:
+        _write_index(p, agg)
+    return agg
+
+
+def _write_index(p: Path, agg: _Aggregate) -> None:
+    """Replace the sidecar with a single record covering *agg* (fresh or compacted index)."""
+    target = _index_path(p)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(_encode(agg, 0))
+        os.replace(tmp, target)
+    except (OSError, TypeError, ValueError):  # read-only directory or an unserializable value
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+
+
+def _append_index(p: Path, delta: _Aggregate, start: int) -> None:
+    try:
+        line = _encode(delta, start)
+        with _index_path(p).open("ab") as f:
+            f.write(line)
+    except (OSError, TypeError, ValueError):  # the in-process copy still works
+        pass
+
+
+def _aggregate(path: Path | None) -> _Aggregate:
+    """Return aggregates covering the whole log, parsing only what was appended since the last call."""
+    p = _log_path(path)
+    try:
+        f = p.open("rb")
+    except FileNotFoundError:
+        return _Aggregate()
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        agg = _AGGREGATES.get(p) or _read_index(p)
+        if agg is None or not agg.continues(f, size):
+            agg = _Aggregate()
+            agg.extend(f)
+            _write_index(p, agg)
+        elif agg.offset < size:
+            start = agg.offset
+            delta = agg.following()
+            delta.extend(f)
+            if delta.offset != start:
+                agg.merge(delta)
+                _append_index(p, delta, start)
+        f.seek(agg.offset)
+        unterminated = f.read()
+    _AGGREGATES[p] = agg
+    return agg.with_unterminated(unterminated) if unterminated else agg
 
 
 # ── traces ───────────────────────────────────────────────────────────────────
@@ -48,96 +478,99 @@ def list_traces(path: Path | None = None) -> list[dict[str, Any]]:
     Returns list of dicts:
         trace_id, agent, event_count, duration_ms, started, types
     """
-    events = _load_events(path)
-    by_trace: dict[str, list[dict]] = defaultdict(list)
-    for e in events:
-        tid = e.get("trace_id")
-        if tid:
-            by_trace[tid].append(e)
-
-    summaries: list[dict[str, Any]] = []
-    for tid, tevents in by_trace.items():
-        tevents.sort(key=lambda e: e.get("seq", 0))
-        agents = {e.get("agent") for e in tevents if e.get("agent")}
-        types = Counter(e.get("type", "?") for e in tevents)
-        # Duration from first to last event
-        duration_ms = None
-        for e in tevents:
-            meta = e.get("meta") or {}
-            if "duration_ms" in meta and e.get("type") in ("trace_end", "agent_end"):
-                duration_ms = meta["duration_ms"]
-                break
-
-        summaries.append(
-            {
-                "trace_id": tid,
-                "agents": sorted(agents - {None}),
-                "event_count": len(tevents),
-                "duration_ms": duration_ms,
-                "started": tevents[0].get("ts", ""),
-                "types": dict(types),
-            }
-        )
-    return summaries
+    return [
+        {
+            "trace_id": tid,
+            "agents": sorted(st.agents),
+            "event_count": st.count,
+            "duration_ms": st.duration_ms,
+            "started": st.started,
+            "types": {t: c for t, (c, _) in sorted(st.types.items(), key=lambda kv: kv[1][1])},
+        }
+        for tid, st in _aggregate(path).traces.items()
+    ]
 
 
 def show_trace(trace_id: str, path: Path | None = None) -> list[dict]:
     """Return the ordered sequence of events for a specific trace."""
-    events = _load_events(path)
-    matched = [e for e in events if e.get("trace_id") == trace_id]
+    if not trace_id:  # untraced events are not indexed
+        matched = [e for e in _load_events(path) if e.get("trace_id") == trace_id]
+    else:
+        matched = _read_spans(_log_path(path), _aggregate(path).traces.get(trace_id))
     matched.sort(key=lambda e: e.get("seq", 0))
     return matched
 
 
+def _read_spans(p: Path, st: _TraceState | None) -> list[dict]:
+    if st is None:
+        return []
+    try:
+        with p.open("rb") as f:
+            lines = []
+            for offset, length in st.spans:
+                f.seek(offset)
+                lines.append(f.read(length))
+    except FileNotFoundError:
+        return []
+    return list(_parse_lines(lines))
+
+
 # ── stats ────────────────────────────────────────────────────────────────────
 
 
 def stats(path: Path | None = None) -> dict[str, Any]:
     """Aggregate statistics: counts by type, agents, avg durations, errors."""
-    events = _load_events(path)
-    type_counts = Counter(e.get("type", "?") for e in events)
-    agent_counts = Counter(e.get("agent", "?") for e in events)
-
-    # Duration stats for tool calls
-    tool_durations: list[int] = []
-    model_durations: list[int] = []
-    error_count = 0
-
-    for e in events:
-        meta = e.get("meta") or {}
-        etype = e.get("type", "")
-        dur = meta.get("duration_ms")
-
-        if etype == "tool_end" and dur is not None:
-            tool_durations.append(dur)
-        elif etype == "model_end" and dur is not None:
-            model_durations.append(dur)
-        elif etype in ("error", "tool_error"):
-            error_count += 1
-
-    def _avg(lst: list[int]) -> float:
-        return round(sum(lst) / len(lst), 1) if lst else 0
+    agg = _aggregate(path)
+    tool_calls = sum(agg.tool_hist.values())
+    model_calls = sum(agg.model_hist.values())
+
+    def _avg(total: int | float, count: int) -> float:
+        return round(total / count, 1) if count else 0
 
     return {
-        "total_events": len(events),
-        "by_type": dict(type_counts.most_common()),
-        "by_agent": dict(agent_counts.most_common()),
-        "tool_calls": len(tool_durations),
-        "tool_avg_ms": _avg(tool_durations),
-        "tool_p95_ms": sorted(tool_durations)[int(len(tool_durations) * 0.95)] if tool_durations else 0,
-        "model_calls": len(model_durations),
-        "model_avg_ms": _avg(model_durations),
-        "errors": error_count,
+        "total_events": agg.events,
+        "by_type": _most_common(agg.type_counts),
+        "by_agent": _most_common(agg.agent_counts),
+        "tool_calls": tool_calls,
+        "tool_avg_ms": _avg(agg.tool_sum, tool_calls),
+        "tool_p95_ms": _p95(agg.tool_hist, tool_calls),
+        "model_calls": model_calls,
+        "model_avg_ms": _avg(agg.model_sum, model_calls),
+        "errors": agg.errors,
     }
 
 
+def _most_common(counts: dict[str, int]) -> dict[str, int]:
+    # Stable sort keeps first-seen order among ties, matching ``Counter.most_common``.
+    return dict(sorted(counts.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def _p95(hist: dict[Any, int], total: int) -> int | float:
+    """Nearest-rank p95 (``sorted(values)[int(n * 0.95)]``) from a value histogram."""
+    if not total:
+        return 0
+    k = int(total * 0.95)
+    seen = 0
+    for value in sorted(hist):
+        seen += hist[value]
+        if seen > k:
+            return value
+    return 0
+
+
 # ── tail ─────────────────────────────────────────────────────────────────────
 
 
 def tail(n: int = 20, path: Path | None = None) -> list[dict]:
     """Return the last N events."""
-    events = _load_events(path)
-    return events[-n:] if len(events) > n else events
+    if n <= 0:
+        events = _load_events(path)
+        return events[-n:] if len(events) > n else events
+    p = _log_path(path)
+    try:
+        return _tail_events(p, n)
+    except FileNotFoundError:
+        return []
 
 
 # ── formatting ───────────────────────────────────────────────────────────────
@@ -148,7 +581,7 @@ def format_event(e: dict) -> str:
     ts = e.get("ts", "")[:19]
     seq = e.get("seq", "?")
     etype = e.get("type", "?")
-    agent = e.get("agent", "")
+    agent = e.get("agent") or ""
     msg = e.get("message", "")
     meta = e.get("meta") or {}
 
@@ -156,12 +589,30 @@ def format_event(e: dict) -> str:
     if msg:
         parts.append(f"  {msg[:120]}")
     if meta:
-        compact = {k: v for k, v in meta.items() if k not in ("tool",)}
-        if compact:
-            parts.append(f"  meta: {json.dumps(compact, ensure_ascii=False)[:200]}")
+        # Value types are part of the key: 1, 1.0 and True compare equal but render differently.
+        key = tuple((k, v.__class__, v) for k, v in meta.items() if k != "tool")
+        if key:
+            parts.append(f"  meta: {_format_meta(key)}")
     return "\n".join(parts)
 
 
+def _format_meta(key: tuple[tuple[str, type, Any], ...]) -> str:
+    try:
+        return _format_meta_cached(key)
+    except TypeError:  # nested lists/dicts are unhashable — render without the cache
+        return _render_meta(key)
+
+
+@lru_cache(maxsize=4096)
+def _format_meta_cached(key: tuple[tuple[str, type, Any], ...]) -> str:
+    # Re-rendering the same events (tail/show_trace in a loop) skips the JSON encode.
+    return _render_meta(key)
+
+
+def _render_meta(key: tuple[tuple[str, type, Any], ...]) -> str:
+    return json.dumps({k: v for k, _, v in key}, ensure_ascii=False)[:200]
+
+
 def format_trace_summary(s: dict) -> str:
     """Pretty-format a trace summary for terminal output."""
     agents = ", ".join(s["agents"]) or "?"
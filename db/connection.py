@@ -32,7 +32,16 @@ async def get_pool() -> asyncpg.Pool:
             "DATABASE_URL",
             "postgresql://localhost:5432/localagents",
         )
-        _pool = await asyncpg.create_pool(dsn, min_size=2, max_size=10)
+        # create_pool() already opens min_size connections concurrently, so the
+        # handshakes are paid here rather than on the first request.
+        _pool = await asyncpg.create_pool(
+            dsn,
+            min_size=2,
+            max_size=10,
+            max_inactive_connection_lifetime=300,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+        )
         logger.info("Database pool created: %s", dsn.split("@")[-1] if "@" in dsn else dsn)
     return _pool
 
@@ -58,10 +67,40 @@ async def run_migrations() -> None:
 
     sql_files = sorted(migrations_dir.glob("*.sql"))
     async with pool.acquire() as conn:
-        for sql_file in sql_files:
-            sql = sql_file.read_text(encoding="utf-8")
-            try:
-                await conn.execute(sql)
+        await conn.execute(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            " name TEXT PRIMARY KEY,"
+            " applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW())"
+        )
+        applied = {row["name"] for row in await conn.fetch("SELECT name FROM schema_migrations")}
+        pending = [f for f in sql_files if f.name not in applied]
+        if not pending:
+            return
+        # Bare (no-argument) execute() goes over the simple query protocol, so the
+        # whole batch of migration SQL is a single round trip.
+        # ";" on its own line so a trailing "-- comment" cannot swallow it.
+        script = "".join(f"{f.read_text(encoding='utf-8')}\n;\n" for f in pending)
+        try:
+            async with conn.transaction():
+                await conn.execute(script)
+                await conn.executemany(
+                    "INSERT INTO schema_migrations (name) VALUES ($1)", [(f.name,) for f in pending]
+                )
+        except Exception as e:
+            logger.warning("Batched migrations rolled back (%s); retrying file by file", e)
+        else:
+            for sql_file in pending:
                 logger.info("Migration applied: %s", sql_file.name)
+            return
+
+        # Slow path: one file per transaction so the failure names its migration. Later files may
+        # depend on the broken one, so stop there and fail startup rather than limp on.
+        for sql_file in pending:
+            try:
+                async with conn.transaction():
+                    await conn.execute(sql_file.read_text(encoding="utf-8"))
+                    await conn.execute("INSERT INTO schema_migrations (name) VALUES ($1)", sql_file.name)
             except Exception as e:
-                logger.warning("Migration %s (may already exist): %s", sql_file.name, e)
+                logger.error("Migration %s failed: %s", sql_file.name, e)
+                raise
+            logger.info("Migration applied: %s", sql_file.name)
@@ -17,32 +17,33 @@ logger = logging.getLogger(__name__)
 # ── module-level singleton ──────────────────────────────────────────────
 _generate_fn: Any = None  # cached reference to mlx_audio generate_audio
 _lock = threading.Lock()
-_ready = False
+_checked_paths: set[str] = set()  # model paths already verified on disk
+# MLX generation is not reentrant — concurrent speak_text() calls take turns.
+_generate_lock = threading.Lock()
 
 
 def _ensure_ready(*, model_path: str) -> Any:
     """Import mlx_audio and verify the model path. Thread-safe."""
-    global _generate_fn, _ready
-    if _ready and _generate_fn is not None:
+    global _generate_fn
+    if _generate_fn is not None and model_path in _checked_paths:
         return _generate_fn
     with _lock:
-        if _ready and _generate_fn is not None:
-            return _generate_fn
-        try:
-            from mlx_audio.tts.generate import generate_audio
-        except Exception as exc:
-            raise RuntimeError(f"mlx-audio import failed: {exc}") from exc
-
-        local_path = Path(model_path).expanduser()
-        if not local_path.exists():
-            raise RuntimeError(
-                f"MLX model path not found: {local_path}. "
-                "Download offline models or set TTS_MLX_MODEL to an existing local path."
-            )
-
-        _generate_fn = generate_audio
-        _ready = True
-        logger.info("MLX-TTS ready (model_path=%s)", model_path)
+        if _generate_fn is None:
+            try:
+                from mlx_audio.tts.generate import generate_audio
+            except Exception as exc:
+                raise RuntimeError(f"mlx-audio import failed: {exc}") from exc
+            _generate_fn = generate_audio
+
+        if model_path not in _checked_paths:
+            local_path = Path(model_path).expanduser()
+            if not local_path.exists():
+                raise RuntimeError(
+                    f"MLX model path not found: {local_path}. "
+                    "Download offline models or set TTS_MLX_MODEL to an existing local path."
+                )
+            _checked_paths.add(model_path)
+            logger.info("MLX-TTS ready (model_path=%s)", model_path)
         return _generate_fn
 
 
@@ -76,13 +77,14 @@ def speak_text(
         return
 
     generate_audio = _ensure_ready(model_path=model_path)
-    generate_audio(
-        text=text.strip(),
-        model_path=model_path,
-        voice=voice,
-        speed=float(speed),
-        lang_code=lang_code,
-        stream=True,
-        play=True,
-        verbose=False,
-    )
+    with _generate_lock:
+        generate_audio(
+            text=text.strip(),
+            model_path=model_path,
+            voice=voice,
+            speed=float(speed),
+            lang_code=lang_code,
+            stream=True,
+            play=True,
+            verbose=False,
+        )
@@ -11,22 +11,43 @@ import logging
 import os
 import tempfile
 import threading
+import wave
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+from core.utils.helpers import env_bool
+
 logger = logging.getLogger(__name__)
 
 # ── module-level singleton ──────────────────────────────────────────────
 _model: Any = None
 _lock = threading.Lock()
+_warmed = False  # one throwaway inference has run on _model
+
+
+@cache
+def _env_allow_remote() -> bool:
+    """``QWEN3_ASR_ALLOW_REMOTE``, read once — the environment is fixed for the process lifetime."""
+    return env_bool("QWEN3_ASR_ALLOW_REMOTE")
 
 
 def _resolve_allow_remote(allow_remote: bool | None) -> bool:
     if allow_remote is None:
-        return os.getenv("QWEN3_ASR_ALLOW_REMOTE", "false").lower() in ("true", "1", "yes")
+        return _env_allow_remote()
     return bool(allow_remote)
 
 
+@cache
+def _qwen_asr_import_error() -> str | None:
+    """Try ``import qwen_asr`` once — a missing package would otherwise re-scan sys.path on every health check."""
+    try:
+        import qwen_asr  # noqa: F401
+    except Exception as exc:
+        return str(exc)
+    return None
+
+
 def _load_model(*, model_name: str, device_map: str, allow_remote: bool) -> Any:
     """Import qwen_asr and load the model. Raises RuntimeError on failure."""
     try:
@@ -90,23 +111,66 @@ def _get_model(*, model_name: str, device_map: str, allow_remote: bool) -> Any:
         return _model
 
 
+def _warm_inference(model: Any) -> None:
+    """Run one throwaway transcription so lazy kernel/tokenizer init is paid before the first request.
+
+    Uses ``QWEN3_ASR_WARMUP_FILE`` when set (real speech exercises more of the decoder), otherwise one
+    second of 16 kHz silence.
+    """
+    if clip := os.getenv("QWEN3_ASR_WARMUP_FILE", "").strip():
+        model.transcribe(audio=clip)
+        return
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        with wave.open(tmp, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(bytes(2 * 16000))
+        temp_path = Path(tmp.name)
+    try:
+        model.transcribe(audio=str(temp_path))
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
 # ── public API ──────────────────────────────────────────────────────────
 
 
-def warmup(
+def load_model(
     *,
     model_name: str | None = None,
     device_map: str | None = None,
     allow_remote: bool | None = None,
-) -> None:
-    """Pre-load the ASR model so it is warm for the first request."""
-    _get_model(
+) -> Any:
+    """Load the ASR model into memory (no-op once loaded) without running any inference."""
+    return _get_model(
         model_name=model_name or os.getenv("QWEN3_ASR_MODEL", "models/qwen3-asr-0.6b"),
         device_map=device_map or os.getenv("QWEN3_ASR_DEVICE_MAP", "auto"),
         allow_remote=_resolve_allow_remote(allow_remote),
     )
 
 
+def warmup(
+    *,
+    model_name: str | None = None,
+    device_map: str | None = None,
+    allow_remote: bool | None = None,
+) -> None:
+    """Pre-load the ASR model and run one warm-up inference so it is warm for the first request."""
+    global _warmed
+    model = load_model(model_name=model_name, device_map=device_map, allow_remote=allow_remote)
+    if _warmed:
+        return
+    with _lock:
+        if _warmed:
+            return
+        try:
+            _warm_inference(model)
+        except Exception as exc:  # the model itself loaded — a failed warm-up only costs first-call latency
+            logger.warning("Qwen3-ASR warm-up inference failed: %s", exc)
+        _warmed = True
+
+
 def health_check(
     *,
     model_name: str,
@@ -117,10 +181,8 @@ def health_check(
     resolved = _resolve_allow_remote(allow_remote)
 
     # Quick import check
-    try:
-        import qwen_asr  # noqa: F401
-    except Exception as exc:
-        return {"ready": False, "reason": f"qwen_asr import error: {exc}"}
+    if (import_error := _qwen_asr_import_error()) is not None:
+        return {"ready": False, "reason": f"qwen_asr import error: {import_error}"}
 
     if not resolved:
         local_candidate = Path(model_name).expanduser()
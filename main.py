@@ -2,12 +2,6 @@
 
 import argparse
 
-from dotenv import load_dotenv
-
-load_dotenv()  # Load .env into os.environ before anything else
-
-import uvicorn  # noqa: E402
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run the LocalAgents system")
@@ -16,6 +10,13 @@ def main() -> None:
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
     args = parser.parse_args()
 
+    # Deferred until the arguments parse — ``--help`` and usage errors skip both imports.
+    from dotenv import load_dotenv
+
+    load_dotenv()  # Load .env into os.environ before the app is imported
+
+    import uvicorn
+
     print(f"🚀 Starting LocalAgents on http://{args.host}:{args.port}")
 
     uvicorn.run(
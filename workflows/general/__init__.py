@@ -5,6 +5,6 @@ The orchestrator delegates to specialised agents for shell commands,
 web search, and browser automation.
 """
 
-from .orchestrator import build_orchestrator, orchestrator
+from .orchestrator import build_orchestrator, get_agent, orchestrator
 
-__all__ = ["build_orchestrator", "orchestrator"]
+__all__ = ["build_orchestrator", "get_agent", "orchestrator"]
@@ -1,14 +1,15 @@
 """
 Chrome Agent — browser automation via Chrome DevTools MCP.
 
-MCP tools are initialized at startup via ``create_chrome_agent()``.
+MCP tools are initialized at startup via ``create_chrome_agent()``; the agent owns
+the MCP connection and releases it in ``await agent.aclose()``.
 """
 
 from __future__ import annotations
 
 from core.engine import ReActAgent
 from core.utils.logging import log_info
-from core.tools import initialize_mcp_tools
+from core.tools import close_mcp_client, initialize_mcp_tools
 
 # Chrome DevTools MCP Server Configuration
 SERVER_CONFIG = {
@@ -34,23 +35,28 @@ PRIMARY_TOOLS = [
 
 async def create_chrome_agent() -> ReActAgent:
     """Async factory — initializes MCP tools, returns a ready agent."""
-    wrapped_tools, _client = await initialize_mcp_tools(SERVER_CONFIG, PRIMARY_TOOLS)
-
-    agent = ReActAgent(
-        name="chrome_agent",
-        description=(
-            "Browser automation agent using Chrome DevTools.\n"
-            "\n"
-            "Best for:\n"
-            "- Navigating web pages and taking screenshots\n"
-            "- Clicking elements and filling forms\n"
-            "- Running JavaScript in the browser\n"
-            "- Web scraping and data extraction\n"
-            "\n"
-            "Tools: navigate_page, take_screenshot, click, evaluate_script, take_snapshot"
-        ),
-        system_instructions="chrome_agent",
-        tools=wrapped_tools,
-    )
+    wrapped_tools, client = await initialize_mcp_tools(SERVER_CONFIG, PRIMARY_TOOLS)
+
+    try:
+        agent = ReActAgent(
+            name="chrome_agent",
+            description=(
+                "Browser automation agent using Chrome DevTools.\n"
+                "\n"
+                "Best for:\n"
+                "- Navigating web pages and taking screenshots\n"
+                "- Clicking elements and filling forms\n"
+                "- Running JavaScript in the browser\n"
+                "- Web scraping and data extraction\n"
+                "\n"
+                "Tools: navigate_page, take_screenshot, click, evaluate_script, take_snapshot"
+            ),
+            system_instructions="chrome_agent",
+            tools=wrapped_tools,
+        )
+    except BaseException:
+        await close_mcp_client(client)
+        raise
+    agent.attach_mcp_client(client)
     log_info(__name__, "Chrome agent initialized with %d tools", len(wrapped_tools))
     return agent
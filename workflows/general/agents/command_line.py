@@ -10,6 +10,9 @@ from __future__ import annotations
 import re
 import shlex
 import subprocess
+import threading
+from functools import lru_cache
+from typing import IO
 
 from core.engine import ReActAgent
 
@@ -23,7 +26,44 @@ _BLACKLIST_PATTERNS = [
     r"\bshutdown\b|\breboot\b|\bhalt\b",
     r":",  # fork-bomb
 ]
-_BLACKLIST_RE = [re.compile(p, re.IGNORECASE) for p in _BLACKLIST_PATTERNS]
+# One alternation so a command is scanned once rather than once per pattern.
+_BLACKLIST_RE = re.compile("|".join(f"(?:{p})" for p in _BLACKLIST_PATTERNS), re.IGNORECASE)
+
+# ── tokenizing ───────────────────────────────────────────────────────────────
+
+# Anything shlex would treat differently from str.split(): quotes, escapes, and the whitespace
+# characters that str.split() breaks on but shlex does not.
+_NEEDS_SHLEX_RE = re.compile(r"[\"'\\\x0b\x0c\x1c-\x1f]|[^\x00-\x7f]")
+
+
+@lru_cache(maxsize=256)
+def _tokenize(command: str) -> tuple[str, ...]:
+    """Split *command* like ``shlex.split``, skipping the tokenizer for plain commands."""
+    if _NEEDS_SHLEX_RE.search(command) is None:
+        return tuple(command.split())
+    return tuple(shlex.split(command))
+
+
+# ── output capture ───────────────────────────────────────────────────────────
+
+_OUTPUT_LIMIT = 4000  # characters returned to the agent
+# Bytes kept per stream: enough for _OUTPUT_LIMIT + 1 characters even if every one is 4-byte UTF-8.
+_CAPTURE_BYTES = (_OUTPUT_LIMIT + 1) * 4
+_READ_CHUNK = 64 * 1024
+
+
+def _drain(stream: IO[bytes], keep: list[bytes]) -> None:
+    """Read *stream* to EOF, keeping only its first ``_CAPTURE_BYTES`` (the rest is discarded)."""
+    kept = 0
+    with stream:
+        while chunk := stream.read(_READ_CHUNK):
+            if kept < _CAPTURE_BYTES:
+                keep.append(chunk[: _CAPTURE_BYTES - kept])
+                kept += len(keep[-1])
+
+
+def _decode(parts: list[bytes]) -> str:
+    return b"".join(parts).decode("utf-8", errors="replace")
 
 
 # ── tool ─────────────────────────────────────────────────────────────────────
@@ -47,26 +87,41 @@ def execute_command(inputs: dict) -> str:
     timeout = inputs.get("timeout", 10)
     allow_sudo = inputs.get("allow_sudo", False)
 
+    # The blacklist scans the raw string — reject before paying for tokenization.
+    if _BLACKLIST_RE.search(command):
+        return "unsafe to run"
+
     try:
-        argv = shlex.split(command)
+        argv = list(_tokenize(command))
     except Exception:
         argv = [command]
 
     if any(tok.lower() == "sudo" for tok in argv) and not allow_sudo:
         return "unsafe to run"
 
-    for rx in _BLACKLIST_RE:
-        if rx.search(command):
-            return "unsafe to run"
-
     try:
-        proc = subprocess.run(argv, cwd=cwd, capture_output=True, text=True, timeout=timeout, shell=False)
-        result = proc.stdout or proc.stderr or ""
-        if len(result) > 4000:
-            result = result[:4000] + "\n...[truncated]"
+        proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False)
+        # Stream both pipes with bounded capture instead of buffering everything the command prints.
+        stdout: list[bytes] = []
+        stderr: list[bytes] = []
+        readers = [
+            threading.Thread(target=_drain, args=(proc.stdout, stdout), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stderr, stderr), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return "Command timed out"
+        for reader in readers:
+            reader.join()
+        result = _decode(stdout) or _decode(stderr)
+        if len(result) > _OUTPUT_LIMIT:
+            result = result[:_OUTPUT_LIMIT] + "\n...[truncated]"
         return result
-    except subprocess.TimeoutExpired:
-        return "Command timed out"
     except FileNotFoundError:
         return f"Command not found: {argv[0] if argv else command}"
     except Exception as e:
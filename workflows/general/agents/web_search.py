@@ -6,6 +6,7 @@ Module-level ``web_search_agent`` is ready at import.
 
 from __future__ import annotations
 
+import threading
 import warnings
 from typing import Any
 
@@ -18,28 +19,35 @@ warnings.filterwarnings(
 )
 
 
-_DDGS_CLASS: type | None = None
-_DDGS_IMPORT_ERROR: str | None = None
+# Resolved once at import; ``_DDGS_CLASS`` is None when neither package is installed.
+_DDGS_CLASS: type | None
+try:
+    from ddgs import DDGS as _DDGS_CLASS  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        from duckduckgo_search import DDGS as _DDGS_CLASS
+    except ImportError:
+        _DDGS_CLASS = None
 
 
-def _get_ddgs_class() -> type | None:
-    global _DDGS_CLASS, _DDGS_IMPORT_ERROR
-    if _DDGS_CLASS is not None:
-        return _DDGS_CLASS
-    if _DDGS_IMPORT_ERROR:
-        return None
+# Tried in order — the next backend is only contacted when the previous one fails or finds nothing.
+_BACKENDS = ("auto", "html", "lite")
 
-    try:
-        from ddgs import DDGS as _DDGS  # type: ignore[import-not-found]
-    except ImportError:
-        try:
-            from duckduckgo_search import DDGS as _DDGS
-        except ImportError:
-            _DDGS_IMPORT_ERROR = "missing ddgs/duckduckgo-search package"
-            return None
+# One long-lived client per thread so its HTTP session (TLS, cookies) is reused across searches.
+# DDGS wraps a stateful HTTP client that is not documented as thread-safe, so threads never share one.
+_LOCAL = threading.local()
+
+
+def _get_ddgs(ddgs_class: type) -> Any:
+    ddgs = getattr(_LOCAL, "ddgs", None)
+    if ddgs is None:
+        ddgs = _LOCAL.ddgs = ddgs_class()
+    return ddgs
 
-    _DDGS_CLASS = _DDGS
-    return _DDGS_CLASS
+
+def _discard_ddgs() -> None:
+    """Drop this thread's client after a failure so the next attempt starts a fresh session."""
+    _LOCAL.ddgs = None
 
 
 def _resolve_query(inputs: dict[str, Any]) -> str:
@@ -89,13 +97,24 @@ def _resolve_timelimit(inputs: dict[str, Any]) -> str | None:
     return None
 
 
+def _search_backend(ddgs_class: type, query: str, backend: str, params: dict[str, Any]) -> Any:
+    try:
+        return _get_ddgs(ddgs_class).text(query, backend=backend, **params)
+    except Exception:
+        _discard_ddgs()
+        raise
+
+
 def _build_results(hits: list[dict[str, Any]]) -> str:
     results: list[str] = []
     for i, hit in enumerate(hits, 1):
-        title = str(hit.get("title") or "No title")
-        url = str(hit.get("href") or hit.get("url") or "No URL")
-        snippet = str(hit.get("body") or hit.get("snippet") or "No snippet")[:200]
-        results.append(f"{i}. {title}\n   URL: {url}\n   {snippet}")
+        # The f-string formats non-str values itself; only the snippet needs a real str to slice.
+        title = hit.get("title") or "No title"
+        url = hit.get("href") or hit.get("url") or "No URL"
+        snippet = hit.get("body") or hit.get("snippet") or "No snippet"
+        if snippet.__class__ is not str:
+            snippet = str(snippet)
+        results.append(f"{i}. {title}\n   URL: {url}\n   {snippet[:200]}")
     return "Search Results:\n\n" + "\n\n".join(results)
 
 
@@ -122,35 +141,26 @@ def web_search(inputs: dict[str, Any]) -> str:
     region = _resolve_region(inputs)
     safesearch = _resolve_safesearch(inputs)
     timelimit = _resolve_timelimit(inputs)
-    backends = ("auto", "html", "lite")
     backend_errors: list[str] = []
-    ddgs_class = _get_ddgs_class()
-    if ddgs_class is None:
+    if _DDGS_CLASS is None:
         return "Error: search backend package not installed (install 'ddgs' or 'duckduckgo-search')."
 
-    for backend in backends:
+    params = {"region": region, "safesearch": safesearch, "timelimit": timelimit, "max_results": max_results}
+    for backend in _BACKENDS:
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                with ddgs_class() as ddgs:
-                    hits = ddgs.text(
-                        query,
-                        region=region,
-                        safesearch=safesearch,
-                        timelimit=timelimit,
-                        backend=backend,
-                        max_results=max_results,
-                    )
-            if not hits:
-                continue
-            return _build_results(hits)
+                hits = _search_backend(_DDGS_CLASS, query, backend, params)
         except Exception as exc:
             backend_errors.append(f"{backend}: {exc}")
+            continue
+        if hits:
+            return _build_results(hits)
 
     if backend_errors:
         return (
             f"No results found for: {query}. "
-            f"Backends attempted: {', '.join(backends)}. "
+            f"Backends attempted: {', '.join(_BACKENDS)}. "
             f"Last errors: {' | '.join(backend_errors[:2])}"
         )
     return f"No results found for: {query}"
@@ -14,11 +14,21 @@ from core.engine import ReActAgent
 # Module-level singleton — populated by ``build_orchestrator()``
 orchestrator: ReActAgent | None = None
 
-# All sub-agents available to the orchestrator
-_SUB_AGENTS = [
-    command_line_agent,
-    web_search_agent,
-]
+# All sub-agents available to the orchestrator, keyed by name
+_SUB_AGENTS: dict[str, ReActAgent] = {
+    agent.name: agent
+    for agent in (
+        command_line_agent,
+        web_search_agent,
+    )
+}
+# Tool tuple handed to ReActAgent (immutable — shared by every rebuild)
+_SUB_AGENT_TOOLS = tuple(_SUB_AGENTS.values())
+
+
+def get_agent(name: str) -> ReActAgent | None:
+    """Return the sub-agent registered under *name*, or None."""
+    return _SUB_AGENTS.get(name)
 
 
 def build_orchestrator() -> ReActAgent:
@@ -29,6 +39,6 @@ def build_orchestrator() -> ReActAgent:
         name="orchestrator",
         description="The main assistant that coordinates and delegates tasks to specialized agents.",
         system_instructions="orchestrator",
-        tools=list(_SUB_AGENTS),
+        tools=_SUB_AGENT_TOOLS,  # ReActAgent validates into its own list
     )
     return orchestrator
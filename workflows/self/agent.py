@@ -10,7 +10,7 @@ from __future__ import annotations
 from core.engine import ReActAgent
 from workflows.self.tools import add_habit, remove_habit, check_habit, get_self_status
 
-tools = [add_habit, remove_habit, check_habit, get_self_status]
+tools = (add_habit, remove_habit, check_habit, get_self_status)
 
 # Module-level singleton
 self_agent: ReActAgent | None = None